@@ -4,10 +4,14 @@ Chart Configuration Data Classes
 Defines data classes for configuring different types of charts (line, bar, bubble, status).
 """
 
+import copy
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Literal
+from typing import List, Optional, Dict, Literal, Tuple
+import numpy as np
 import pandas as pd
 
+from domain.pid_info import PidInfo
+
 ChartType = Literal["line", "bar", "bubble", "status"]
 
 
@@ -45,6 +49,8 @@ class ChartConfig:
     """
     # Data
     data: pd.DataFrame
+    # Downsampled {series: (x, y)} arrays for drawing line charts; data stays full for readouts
+    data_reduced: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None
     
     # Chart type
     chart_type: ChartType = "line"
@@ -72,7 +78,7 @@ class ChartConfig:
     series_styles: Dict[str, SeriesStyle] = field(default_factory=dict)
     
     # PID information (for unit labels)
-    pid_info: Optional[Dict[str, Dict]] = None
+    pid_info: Optional[Dict[str, PidInfo]] = None
     
     # Chain of custody metadata
     file_name: Optional[str] = None
@@ -82,34 +88,95 @@ class ChartConfig:
     # Bubble chart specific: column to use for bubble size
     bubble_size_column: Optional[str] = None
     bubble_size_scale: float = 50.0  # Multiplier for bubble sizes
+
+    # Unit labels already looked up, keyed by series tuple (valid for _label_cache_source only)
+    _label_cache: Dict[tuple, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _label_cache_source: Optional[Dict[str, PidInfo]] = field(default=None, init=False, repr=False, compare=False)
+    # (data frame, detected x column) from the last auto-detecting get_x_column call
+    _x_column_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # (data frame, x column, values) from the last x_numeric call
+    _x_numeric_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # (data frame, x column, (min, max)) from the last get_x_range call
+    _x_range_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def get_x_column(self) -> Optional[str]:
-        """Determine the X-axis column from data."""
+        """Determine the X-axis column from data. Auto-detection is cached until data changes."""
         if self.x_column:
             return self.x_column
         
+        # Called several times per plot (renderer, downsampling, slider) - the dtype checks
+        # only need to run once per data frame
+        cached = self._x_column_cache
+        if cached is not None and cached[0] is self.data:
+            return cached[1]
+        
         # Auto-detect: prefer Time (MM:SS), then Time, then Frame
         if "Time (MM:SS)" in self.data.columns and pd.api.types.is_numeric_dtype(self.data["Time (MM:SS)"]):
-            return "Time (MM:SS)"
+            x_key = "Time (MM:SS)"
         elif "Time" in self.data.columns and (pd.api.types.is_numeric_dtype(self.data["Time"]) or pd.api.types.is_datetime64_any_dtype(self.data["Time"]) or pd.api.types.is_timedelta64_dtype(self.data["Time"])):
-            return "Time"
+            x_key = "Time"
         elif "Frame" in self.data.columns and pd.api.types.is_numeric_dtype(self.data["Frame"]):
-            return "Frame"
+            x_key = "Frame"
+        else:
+            x_key = None
         
-        return None
+        self._x_column_cache = (self.data, x_key)
+        return x_key
+    
+    def x_numeric(self) -> np.ndarray:
+        """X-axis values as plotted - seconds for timedelta Time columns. Cached until data changes."""
+        x_key = self.get_x_column()
+        cached = self._x_numeric_cache
+        if cached is not None and cached[0] is self.data and cached[1] == x_key:
+            return cached[2]
+        
+        if x_key and x_key in self.data.columns:
+            column = self.data[x_key]
+            if pd.api.types.is_timedelta64_dtype(column):
+                values = column.dt.total_seconds().to_numpy()
+            else:
+                values = column.to_numpy()
+        else:
+            values = self.data.index.to_numpy()
+        self._x_numeric_cache = (self.data, x_key, values)
+        return values
+    
+    def get_x_range(self) -> Tuple[float, float]:
+        """(min, max) of the X-axis values - seconds for timedelta Time columns. Cached until data changes."""
+        x_key = self.get_x_column()
+        cached = self._x_range_cache
+        if cached is not None and cached[0] is self.data and cached[1] == x_key:
+            return cached[2]
+        
+        values = self.x_numeric()
+        x_range = (float(np.nanmin(values)), float(np.nanmax(values)))
+        self._x_range_cache = (self.data, x_key, x_range)
+        return x_range
     
     def get_axis_label(self, axis_config: AxisConfig) -> str:
         """Get the label for an axis, using PID units if available."""
         if axis_config.label:
             return axis_config.label
         
-        # Try to infer from PID info
+        # Forget cached labels if a different pid_info has been assigned
+        if self._label_cache_source is not self.pid_info:
+            self._label_cache.clear()
+            self._label_cache_source = self.pid_info
+
+        key = tuple(axis_config.series)
+        label = self._label_cache.get(key)
+        if label is None:
+            label = self._first_unit(axis_config.series)
+            self._label_cache[key] = label
+        return label
+
+    def _first_unit(self, series: List[str]) -> str:
+        """Unit of the first series that has one in pid_info, otherwise "Value"."""
         if self.pid_info:
-            for pid_name in axis_config.series:
+            for pid_name in series:
                 info = self.pid_info.get(pid_name)
-                unit = (info or {}).get("Unit") if info else None
-                if unit:
-                    return unit
+                if info and info.unit:
+                    return info.unit
         
         return "Value"
     
@@ -123,3 +190,15 @@ class ChartConfig:
             return SeriesStyle(linestyle="--")
         else:
             return SeriesStyle()
+    
+    def clone_sharing_data(self) -> "ChartConfig":
+        """
+        Deep copy of this config that shares the data frame, reduced arrays and
+        pid_info with the original instead of copying them.
+        
+        Nothing writes into those after a config is built (renderers work on their
+        own copy), so the clone is still independent for everything that is edited:
+        axes, limits, titles and styles.
+        """
+        shared = (self.data, self.data_reduced, self.pid_info)
+        return copy.deepcopy(self, memo={id(obj): obj for obj in shared})
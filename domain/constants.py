@@ -6,6 +6,12 @@ APP_TITLE = "Snapshot Decoder"
 # Help URL
 UPDATE_URL = "https://nathanladd.github.io/Snapshot-Decoder/"
 
+# Hover tooltip style for mplcursors - the library's rounded box, in white instead of yellow.
+# Passed as annotation_kwargs so each tooltip is created styled rather than restyled on every hover
+HOVER_ANNOTATION_KWARGS = {
+    "bbox": dict(boxstyle="round,pad=.5", fc="white", alpha=0.9, ec="k"),
+}
+
 
 # Buttons for each V1 snapshot type
 # Button name, COMMAND NAME, tooltip
@@ -75,6 +81,13 @@ BUTTONS_BY_TYPE: dict[SnapType, list[tuple[str, str, str]]] = {
     ],
 }
 
+# Tooltip of each quick chart button, looked up by (snapshot type, action id) - used as the chart title
+TOOLTIP_BY_TYPE_CMD: dict[tuple[SnapType, str], str] = {
+    (snaptype, cmd): tip
+    for snaptype, buttons in BUTTONS_BY_TYPE.items()
+    for _, cmd, tip in buttons
+}
+
 # Standardize the labels found in the header. 
 # - labels we expect in row 0..3 of collumn 0, with values in collumn 1.
 # squeez and clean the name from the snapshot cell and map it to a more readable name
@@ -0,0 +1,14 @@
+"""
+PID Metadata
+
+Defines the per-PID description and unit record used by Snapshot.pid_info.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class PidInfo:
+    """Description and unit of measure for a single PID."""
+    description: str = ""
+    unit: str = ""
@@ -1,7 +1,8 @@
 from typing import List
 import pandas as pd
 from domain.snaptypes import SnapType
-from domain.constants import BUTTONS_BY_TYPE
+from domain.constants import TOOLTIP_BY_TYPE_CMD
+from utils import seconds_to_hours
 
 # Quick Charts do not pass a chart config data class. I want this method to update all the 
 # controlls on the main ui, then use 'plot chart' to update a chart config.
@@ -12,68 +13,62 @@ chart_type: str="line", primary_ticks: List[float]=None, primary_tick_labels: Li
 show_legend: bool=True):
 
     # Retrieve tooltip for the chart title
-    tooltip = None
-    if snaptype in BUTTONS_BY_TYPE:
-        for button_name, cmd, tip in BUTTONS_BY_TYPE[snaptype]:
-            if cmd == action_id:
-                tooltip = tip
-                break
+    tooltip = TOOLTIP_BY_TYPE_CMD.get((snaptype, action_id))
     
     # Set scripted PID names for primary and secondary axes
-    main_app.primary_series = primary_pids
-    main_app.secondary_series = secondary_pids
+    # (copies, so later edits in the UI never modify the caller's or default lists)
+    main_app.primary_series = list(primary_pids)
+    main_app.secondary_series = list(secondary_pids)
+    main_app._primary_set = set(main_app.primary_series)
+    main_app._secondary_set = set(main_app.secondary_series)
     
-    # Update list boxes
+    # Update list boxes in one insert call each
     main_app.primary_list.delete(0, 'end')
-    for pid in main_app.primary_series:
-        main_app.primary_list.insert('end', pid)
+    main_app.primary_list.insert('end', *main_app.primary_series)
     
     main_app.secondary_list.delete(0, 'end')
-    for pid in main_app.secondary_series:
-        main_app.secondary_list.insert('end', pid)
-    
-    # Set scripted min/max values for axes
-    if primary_min and primary_max:
-        main_app.primary_auto.set(False)
-        main_app.primary_ymin.set(primary_min)
-        main_app.primary_ymax.set(primary_max)
-    else:
-        main_app.primary_auto.set(True)
-    
-    if secondary_min and secondary_max:
-        main_app.secondary_auto.set(False)
-        main_app.secondary_ymin.set(secondary_min)
-        main_app.secondary_ymax.set(secondary_max)
-    else:
-        main_app.secondary_auto.set(True)
-    
-    # Trigger toggle to update entry states
-    main_app._toggle_primary_inputs()
-    main_app._toggle_secondary_inputs()
-    
-    # Set chart type
-    if hasattr(main_app, 'chart_type_var'):
-        main_app.chart_type_var.set(chart_type)
-
-    # Set custom ticks
-    if hasattr(main_app, 'primary_ticks'):
-        main_app.primary_ticks = primary_ticks
-        main_app.primary_tick_labels = primary_tick_labels
-
-    # Set legend visibility
-    if hasattr(main_app, 'show_legend_var'):
-        main_app.show_legend_var.set(show_legend)
-
-    # Generate the chart
-    main_app.plot_combo_chart()
-    
-    # Set custom title if tooltip found
-    if tooltip:
-        main_app.ax_left.set_title(tooltip)
-        # Update working_config title to match so toolbar has correct title for PDF export
-        if main_app.working_config:
-            main_app.working_config.title = tooltip
-        main_app.canvas.draw_idle()
+    main_app.secondary_list.insert('end', *main_app.secondary_series)
+    
+    # Hold the app's trace callbacks while the settings are applied - the chart is plotted once below
+    main_app._suspend_traces = True
+    try:
+        # Set scripted min/max values for axes
+        if primary_min and primary_max:
+            main_app.primary_auto.set(False)
+            main_app.primary_ymin.set(primary_min)
+            main_app.primary_ymax.set(primary_max)
+        else:
+            main_app.primary_auto.set(True)
+    
+        if secondary_min and secondary_max:
+            main_app.secondary_auto.set(False)
+            main_app.secondary_ymin.set(secondary_min)
+            main_app.secondary_ymax.set(secondary_max)
+        else:
+            main_app.secondary_auto.set(True)
+    
+        # Trigger toggle to update entry states
+        main_app._toggle_primary_inputs()
+        main_app._toggle_secondary_inputs()
+    
+        # Set chart type
+        if hasattr(main_app, 'chart_type_var'):
+            main_app.chart_type_var.set(chart_type)
+
+        # Set custom ticks
+        if hasattr(main_app, 'primary_ticks'):
+            main_app.primary_ticks = primary_ticks
+            main_app.primary_tick_labels = primary_tick_labels
+
+        # Set legend visibility
+        if hasattr(main_app, 'show_legend_var'):
+            main_app.show_legend_var.set(show_legend)
+    finally:
+        main_app._suspend_traces = False
+
+    # Generate the chart, titled with the tooltip if there is one. The chart is drawn
+    # later, once its data is prepared, so the title has to go in with the request
+    main_app.plot_combo_chart(title=tooltip)
 
 # ----------------------------------------------------------------------------
 # ----------------------------------V1 Charts----------------------------------
@@ -373,11 +368,9 @@ def V2_show_engine_torque_limits(main_app, snaptype: SnapType):
         main_app.engine.snapshot[display_col] = vals
         new_cols_added.append(display_col)
     
-    # Update the UI PID list so the new columns appear
+    # Update the UI PID list so the new columns appear (and can be searched)
     if new_cols_added and hasattr(main_app, 'pid_list'):
-        for col in new_cols_added:
-            if col not in main_app.pid_list.get(0, 'end'):
-                main_app.pid_list.insert('end', col)
+        main_app.refresh_pid_list()
 
     # Y-axis limits and tick positions are auto-calculated by the chart renderer
     # based on the number of series (1.5 spacing per series)
@@ -482,9 +475,11 @@ def V1EUD_show_speed_load_chart(main_app, snaptype: SnapType):
     # Store axes reference
     main_app.ax_left = ax
     main_app.ax_right = None
+    # Hand-drawn chart - the next series-list plot must not reuse these axes
+    main_app._plotted_series = None
     
     # Update canvas
-    main_app.canvas.draw()
+    main_app.canvas.draw_idle()
     
     # Update working_config for consistency (with custom data)
     from domain.chart_config import ChartConfig, AxisConfig
@@ -505,7 +500,6 @@ def V1EUD_show_speed_band_chart(main_app, snaptype: SnapType):
     Converts seconds to hours for display.
     """
     from domain.chart_config import ChartConfig, AxisConfig
-    from ui.chart_renderer import ChartRenderer
     
     # Column names for speed bands
     columns = [
@@ -532,7 +526,7 @@ def V1EUD_show_speed_band_chart(main_app, snaptype: SnapType):
         if col in frame_zero.columns:
             try:
                 seconds = float(frame_zero[col].iloc[0])
-                hours = round(seconds / 3600, 2)
+                hours = seconds_to_hours(seconds, 2)
                 values.append(hours)
             except (ValueError, IndexError, TypeError):
                 values.append(0.0)
@@ -561,17 +555,13 @@ def V1EUD_show_speed_band_chart(main_app, snaptype: SnapType):
     )
     
     # Render the chart
-    main_app.working_config = config
-    renderer = ChartRenderer(config)
-    main_app.ax_left, main_app.ax_right = renderer.render(main_app.figure, main_app.canvas)
-    main_app.toolbar.chart_config = config
+    main_app.show_custom_chart(config)
 
 def V1EUD_show_elevation_chart(main_app, snaptype: SnapType):
     """
     Build a bar chart showing atmospheric pressure PIDs converted to elevation.
     """
     from domain.chart_config import ChartConfig, AxisConfig
-    from ui.chart_renderer import ChartRenderer
     
     # Column names for speed bands
     columns = [
@@ -601,7 +591,7 @@ def V1EUD_show_elevation_chart(main_app, snaptype: SnapType):
         if col in frame_zero.columns:
             try:
                 seconds = float(frame_zero[col].iloc[0])
-                hours = round(seconds / 3600, 2)
+                hours = seconds_to_hours(seconds, 2)
                 values.append(hours)
             except (ValueError, IndexError, TypeError):
                 values.append(0.0)
@@ -630,17 +620,13 @@ def V1EUD_show_elevation_chart(main_app, snaptype: SnapType):
     )
     
     # Render the chart
-    main_app.working_config = config
-    renderer = ChartRenderer(config)
-    main_app.ax_left, main_app.ax_right = renderer.render(main_app.figure, main_app.canvas)
-    main_app.toolbar.chart_config = config
+    main_app.show_custom_chart(config)
 
 def V1EUD_show_EGT_chart(main_app, snaptype: SnapType):
     """
     Build a bar chart showing EGT hours.
     """
     from domain.chart_config import ChartConfig, AxisConfig
-    from ui.chart_renderer import ChartRenderer
     
     # Column names for speed bands
     columns = [
@@ -670,7 +656,7 @@ def V1EUD_show_EGT_chart(main_app, snaptype: SnapType):
         if col in frame_zero.columns:
             try:
                 seconds = float(frame_zero[col].iloc[0])
-                hours = round(seconds / 3600, 2)
+                hours = seconds_to_hours(seconds, 2)
                 values.append(hours)
             except (ValueError, IndexError, TypeError):
                 values.append(0.0)
@@ -699,7 +685,4 @@ def V1EUD_show_EGT_chart(main_app, snaptype: SnapType):
     )
     
     # Render the chart
-    main_app.working_config = config
-    renderer = ChartRenderer(config)
-    main_app.ax_left, main_app.ax_right = renderer.render(main_app.figure, main_app.canvas)
-    main_app.toolbar.chart_config = config
\ No newline at end of file
+    main_app.show_custom_chart(config)
\ No newline at end of file
@@ -1,13 +1,46 @@
 from __future__ import annotations  # For forward references in type hints (if needed later, e.g., for chart_cart integration)
 
+import copy
 import os
-import math
+import re
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
 from typing import Optional, Dict, List, Tuple
+import numpy as np
 import pandas as pd
 
 from domain.snaptypes import SnapType
+from domain.pid_info import PidInfo
 from domain.constants import HEADER_LABELS, PID_KEY, UNIT_NORMALIZATION, ENGINE_HOURS_COLUMNS
 from file_io.reader_excel import load_xls, load_xlsx
+from utils import seconds_to_hours
+
+# Header keywords that identify a snapshot type, for matching against header rows
+_PID_KEY_SET = frozenset(PID_KEY)
+_PID_KEY_ARRAY = np.array(list(PID_KEY))
+
+# Timestamp written in the snapshot header, e.g. "Nov 21 2025/13.20.57" (%b %d %Y/%H.%M.%S)
+_TS_RE = re.compile(r"([A-Za-z]{3}) (\d{1,2}) (\d{4})/(\d{1,2})\.(\d{1,2})\.(\d{1,2})")
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+    )
+}
+
+# PIDs whose values are text even when they look like numbers (the torque limit bit stream
+# keeps its leading zeros), so they are never converted to numeric columns at load
+_TEXT_PIDS = frozenset({"CoETS_stCurrLimActive"})
+
+# Range an int64 PID column must fit in to be stored as int32
+_INT32 = np.iinfo(np.int32)
+
+# Whole-number floats up to this size convert to int64 exactly (float64 holds every integer up to 2**53)
+_FLOAT_EXACT_INT = 2.0 ** 53
+
+# Recently loaded snapshots keyed on (path, mtime), most recent last. Capped at LOAD_CACHE_SIZE entries
+LOAD_CACHE_SIZE = 4
+_LOAD_CACHE: OrderedDict[Tuple[str, float], Snapshot] = OrderedDict()
 
 
 class Snapshot:
@@ -30,7 +63,11 @@ class Snapshot:
         self.hours: float = 0.0
 
         self.header_list: List[Tuple[str, str]] = []
-        self.pid_info: Dict[str, Dict[str, str]] = {}
+        self.pid_info: Dict[str, PidInfo] = {}
+        # (header row index, snapshot type) found by the last header row scan, reused by _id_snapshot
+        self._header_scan: Optional[Tuple[int, SnapType]] = None
+        # (pid, description, unit) rows for the PID Descriptions window, built once per load
+        self.pid_rows: List[Tuple[str, str, str]] = []
         self.snapshot_type: SnapType = SnapType.EMPTY
         self.mdp_success_rate: float = 0.0
         self.idle_time: float = 0.0
@@ -44,6 +81,44 @@ class Snapshot:
         instance = cls(path)
         instance._load_and_parse()
         return instance
+
+    @classmethod
+    def load_cached(cls, path: str) -> Snapshot:
+        """
+        Load a snapshot, reusing the parse of a recent load if the file hasn't changed since.
+
+        Callers get their own copy (see _session_copy), so columns or units they change
+        never leak into the cached snapshot.
+        """
+        key = snapshot_file_key(path)
+        cached = _LOAD_CACHE.get(key)
+        if cached is None:
+            cached = cls.load(path)
+            _LOAD_CACHE[key] = cached
+            while len(_LOAD_CACHE) > LOAD_CACHE_SIZE:
+                _LOAD_CACHE.popitem(last=False)
+        else:
+            _LOAD_CACHE.move_to_end(key)
+        return cached._session_copy()
+
+    def _session_copy(self) -> Snapshot:
+        """
+        Copy of this snapshot that a session can change without touching the original.
+
+        The data frames are shallow copies: they share column data with the original
+        instead of duplicating the whole workbook, so a new or replaced column (the only
+        way snapshot data is changed after loading) stays in the copy. Never write
+        values into an existing column in place. The small PID lookups are copied outright.
+        """
+        clone = copy.copy(self)
+        if self.raw_table is not None:
+            clone.raw_table = self.raw_table.copy(deep=False)
+        if self.snapshot is not None:
+            clone.snapshot = self.snapshot.copy(deep=False)
+        clone.header_list = list(self.header_list)
+        clone.pid_info = dict(self.pid_info)
+        clone.pid_rows = list(self.pid_rows)
+        return clone
     
     def _load_and_parse(self):
         """
@@ -101,6 +176,9 @@ class Snapshot:
                 self.snapshot["BattU_u"] = pd.to_numeric(self.snapshot["BattU_u"], errors="coerce")
                 self.snapshot["BattU_u"] = self.snapshot["BattU_u"] / 1000
                 self._update_pid_unit("BattU_u", "Volts")
+
+        # Rows for the PID Descriptions window, after every unit fix-up above
+        self.pid_rows = [(pid, info.description, info.unit) for pid, info in self.pid_info.items()]
         
     def _find_engine_hours(self) -> float:
         """
@@ -124,28 +202,28 @@ class Snapshot:
             return 0.0
         
         # Get the row where Frame == 0
-        frame_zero_rows = self.snapshot[self.snapshot["Frame"] == 0]
-        if frame_zero_rows.empty:
+        frame_zero = _first_frame_zero(self.snapshot)
+        if frame_zero is None:
             return 0.0
         
         # Get the unit from pid_info to determine if conversion is needed
         unit = ""
         if column_name in self.pid_info:
-            unit = self.pid_info[column_name].get("Unit", "").lower()
+            unit = self.pid_info[column_name].unit.lower()
         
         # If unit contains "second", convert from seconds to hours
         if "second" in unit:
             try:
-                seconds = float(frame_zero_rows[column_name].iloc[0])
+                seconds = float(self.snapshot[column_name].iloc[frame_zero])
                 # Convert seconds to hours and round to tenth of an hour
-                hours = round(seconds / 3600, 1)
+                hours = seconds_to_hours(seconds)
                 return hours
             except (ValueError, IndexError, TypeError):
                 return 0.0
         else:
             # Unit is hours or unknown, return the value directly
             try:
-                return round(float(frame_zero_rows[column_name].iloc[0]), 1)
+                return round(float(self.snapshot[column_name].iloc[frame_zero]), 1)
             except (ValueError, IndexError, TypeError):
                 return 0.0
 
@@ -168,21 +246,21 @@ class Snapshot:
             return 0.0
         
         # Get the row where Frame == 0
-        frame_zero_rows = self.snapshot[self.snapshot["Frame"] == 0]
-        if frame_zero_rows.empty:
+        frame_zero = _first_frame_zero(self.snapshot)
+        if frame_zero is None:
             return 0.0
         
         # Get the unit from pid_info to determine if conversion is needed
         unit = ""
         if column_name in self.pid_info:
-            unit = self.pid_info[column_name].get("Unit", "").lower()
+            unit = self.pid_info[column_name].unit.lower()
         
         # If unit contains "second", convert from seconds to hours
         if "second" in unit:
             try:
-                seconds = float(frame_zero_rows[column_name].iloc[0])
+                seconds = float(self.snapshot[column_name].iloc[frame_zero])
                 # Convert seconds to hours and round to tenth of an hour
-                hours = round(seconds / 3600, 1)
+                hours = seconds_to_hours(seconds)
                 print(f"Engine Idle Time: {hours}")
                 return hours
             except (ValueError, IndexError, TypeError):
@@ -190,7 +268,7 @@ class Snapshot:
         else:
             # Unit is hours or unknown, return the value directly
             try:
-                return round(float(frame_zero_rows[column_name].iloc[0]), 1)
+                return round(float(self.snapshot[column_name].iloc[frame_zero]), 1)
             except (ValueError, IndexError, TypeError):
                 return 0.0
 
@@ -222,15 +300,15 @@ class Snapshot:
             return 0
         
         # Get the row where Frame == 0
-        frame_zero_row = self.snapshot[self.snapshot["Frame"] == 0]
-        if frame_zero_row.empty:
+        frame_zero = _first_frame_zero(self.snapshot)
+        if frame_zero is None:
             return 0
         
         # Get the MDP_SUCCESS value from Frame == 0
         try:
 
-            mdp_success = int(frame_zero_row["I_C_Mdp_nb_update_success_nvv"].iloc[0])
-            mdp_failure = int(frame_zero_row["I_C_Mdp_nb_update_failure_nvv"].iloc[0])
+            mdp_success = int(self.snapshot["I_C_Mdp_nb_update_success_nvv"].iloc[frame_zero])
+            mdp_failure = int(self.snapshot["I_C_Mdp_nb_update_failure_nvv"].iloc[frame_zero])
             
             total_updates = mdp_failure + mdp_success
             if total_updates == 0:
@@ -276,22 +354,15 @@ class Snapshot:
         if snapshot is None or snapshot.empty:
             return results
 
-        # Get the number of rows to parse: the smaller of 'max_rows' or total rows in the snapshot
-        nrows = min(max_rows, snapshot.shape[0])
-        for r in range(nrows):
+        # Walk the first 'max_rows' rows as plain tuples (no per-row Series)
+        for row in snapshot.head(max_rows).itertuples(index=False, name=None):
             # Stop if we hit the table row containing "frame"
-            try:
-                label_raw = str(snapshot.iat[r, 0]).strip()
-            except Exception:
-                label_raw = ""
+            label_raw = str(row[0]).strip()
             if label_raw and label_raw.lower() == "frame":
                 break
 
             # Pull the value column
-            try:
-                value = str(snapshot.iat[r, 1]).strip()
-            except Exception:
-                value = ""
+            value = str(row[1]).strip() if len(row) > 1 else ""
 
             # Skip truly empty/NaN-ish rows
             if not label_raw or label_raw.lower() == "nan":
@@ -313,25 +384,20 @@ class Snapshot:
             if (not value or value.lower() == "nan" or value.lower() == "none") and len(label_raw) > 8:
                 is_date = False
                 try:
-                    # 1. Try default parsing
-                    pd.to_datetime(label_raw)
+                    # 1. Try the snapshot's own timestamp format (compiled, no dateutil fallback)
+                    parse_snapshot_ts(label_raw)
                     is_date = True
                 except (ValueError, TypeError):
-                    # 2. Try normalizing the string (replace / with space, . with :)
-                    # This handles formats like "Nov 21 2025/13.20.57" -> "Nov 21 2025 13:20:57"
                     try:
-                        # Only apply replacement if it looks like the specific problem format
-                        # (contains slash and dots in what looks like time)
-                        normalized = label_raw.replace("/", " ").replace(".", ":")
-                        pd.to_datetime(normalized)
+                        # 2. Try default parsing
+                        pd.to_datetime(label_raw)
                         is_date = True
-                        # Update the value to the normalized version? Or keep original?
-                        # Usually keeping original is better for data integrity, but normalized is more readable.
-                        # Let's keep original label_raw as value for now, or normalize it if preferred.
                     except (ValueError, TypeError):
-                         # 3. Try explicit format as fallback
+                        # 3. Try normalizing the string (replace / with space, . with :)
+                        # This handles variants like "Nov 21 2025/13.20" -> "Nov 21 2025 13:20"
                         try:
-                            pd.to_datetime(label_raw, format="%b %d %Y/%H.%M.%S")
+                            normalized = label_raw.replace("/", " ").replace(".", ":")
+                            pd.to_datetime(normalized)
                             is_date = True
                         except (ValueError, TypeError):
                             pass
@@ -355,13 +421,19 @@ class Snapshot:
         '''
         ID the snapshot type based on the header row
         '''
+        # Reuse the result of an earlier scan of this same header row
+        if self._header_scan is not None and self._header_scan[0] == header_row_idx:
+            return self._header_scan[1]
+
         # Clean and normalize each cell to lowercase strings
-        row_values = snapshot.iloc[header_row_idx].astype(str).str.strip().str.lower().tolist()
+        row_values = _normalized_block(snapshot.iloc[[header_row_idx]])[0]
 
         # Check if any known header keyword appears in this row
-        for pattern, st in PID_KEY.items():
-            if any(v == pattern for v in row_values):
-                return st
+        matches = _PID_KEY_SET.intersection(row_values)
+        if matches:
+            st = _first_snap_type(matches)
+            self._header_scan = (header_row_idx, st)
+            return st
         # if pattern not found, return EMPTY
         return SnapType.EMPTY
 
@@ -369,47 +441,47 @@ class Snapshot:
         '''
         Find the header row
         '''
-        header_row_idx = None
-        # Scan the first 10 rows
-        for i in range(min(len(snapshot), 10)):
-            # Clean and normalize each cell to lowercase strings
-            row_values = snapshot.iloc[i].astype(str).str.strip().str.lower().tolist()
-            #print(f"Row {i}: {row_values}")
-
-            # Check if any known header keyword appears in this row
-            for pattern, snap_type in PID_KEY.items():
-                if any(v == pattern for v in row_values):
-                    #print(f"Match found in row {i}")
-                    return i  # stop once a match is found
-            #else:
-                # The 'else' on a for-loop runs only if the loop didn't break
-                #print(f"No match found in row {i}")
-
-        if header_row_idx is None:
+        # Scan the first 10 rows, cleaned and normalized to lowercase strings in one pass
+        block = _normalized_block(snapshot.iloc[:10])
+
+        # Mark every cell holding a known header keyword
+        hits = np.isin(block, _PID_KEY_ARRAY)
+        if not hits.any():
             raise ValueError("[Find Header Row] Couldn't locate header row containing useful information.")
 
-    def _extract_pid_descriptions(self, df: pd.DataFrame, header_row_idx: int, start_col: int = 2) -> Dict[str, Dict[str, str]]:
+        # The first hit in row-major order is in the header row
+        header_row_idx = int(np.argmax(hits)) // hits.shape[1]
+        matches = set(block[header_row_idx][hits[header_row_idx]])
+
+        self._header_scan = (header_row_idx, _first_snap_type(matches))
+        return header_row_idx
+
+    def _extract_pid_descriptions(self, df: pd.DataFrame, header_row_idx: int, start_col: int = 2) -> Dict[str, PidInfo]:
         """
         HORIZONTAL TABLES ONLY
         Extract the PID description and PID unit of measure for each PID
         """
         
         # Initialize the dictionary to store PID information
-        # Dictionary <PID Name, Dictionary<Description, Unit>>
-        pid_info: Dict[str, Dict[str, str]] = {}
+        # Dictionary <PID Name, PidInfo(description, unit)>
+        pid_info: Dict[str, PidInfo] = {}
 
         # Row indices for description and unit (guard if out of bounds)
         desc_row = header_row_idx - 1 if _within(df, header_row_idx - 1) else None
         unit_row = header_row_idx + 1 if _within(df, header_row_idx + 1) else None
 
-        for c in range(start_col, len(df.columns)):
-            pid = _to_str(df.iat[header_row_idx, c])
+        # Normalize each row slice in one pass instead of cell by cell
+        n_cols = len(df.columns) - start_col
+        pids = _normalize_array(df.iloc[header_row_idx, start_col:].to_numpy())
+        descriptions = (_normalize_array(df.iloc[desc_row, start_col:].to_numpy())
+                        if desc_row is not None else [""] * n_cols)
+        units = (_normalize_array(df.iloc[unit_row, start_col:].to_numpy())
+                 if unit_row is not None else [""] * n_cols)
+
+        for pid, description, unit in zip(pids, descriptions, units):
             if not pid:
                 continue
 
-            description = _to_str(df.iat[desc_row, c]) if desc_row is not None else ""
-            unit = _to_str(df.iat[unit_row, c]) if unit_row is not None else ""
-
             # Optional: collapse multi-line cells
             description = " ".join(part.strip() for part in description.splitlines() if part.strip())
             unit = " ".join(part.strip() for part in unit.splitlines() if part.strip())
@@ -419,7 +491,7 @@ class Snapshot:
                 if normalized_unit:
                     unit = normalized_unit
 
-            pid_info[pid] = {"Description": description, "Unit": unit}
+            pid_info[pid] = PidInfo(description, unit)
 
         return pid_info
 
@@ -442,7 +514,7 @@ class Snapshot:
         Update the unit for a specific PID in the pid_info dictionary.
         """
         if pid_name in self.pid_info:
-            self.pid_info[pid_name]["Unit"] = new_unit
+            self.pid_info[pid_name] = replace(self.pid_info[pid_name], unit=new_unit)
 
     def _scrub_snapshot(self, raw_snapshot: pd.DataFrame, header_row_idx: int) -> pd.DataFrame:
         """
@@ -456,7 +528,7 @@ class Snapshot:
         Returns the processed snapshot.
         """
         # Set column header row
-        pid_header = raw_snapshot.iloc[header_row_idx].astype(str).str.strip().tolist()
+        pid_header = [str(v).strip() for v in raw_snapshot.iloc[header_row_idx].tolist()]
         snapshot = raw_snapshot.iloc[header_row_idx+1:].copy()
         snapshot.columns = pid_header
 
@@ -479,9 +551,9 @@ class Snapshot:
         # Find the start row where Frame == 0 (if Frame exists) and trim before converting time
         if "Frame" in snapshot.columns:
             snapshot["Frame"] = pd.to_numeric(snapshot["Frame"], errors="coerce")
-            start_idx = snapshot.index[snapshot["Frame"] == 0]
-            if len(start_idx) > 0:
-                snapshot = snapshot.loc[start_idx[0]:].reset_index(drop=True)
+            start = _first_frame_zero(snapshot)
+            if start is not None:
+                snapshot = snapshot.iloc[start:].reset_index(drop=True)
             
         if "Time" in snapshot.columns:
             snapshot["Time"] = pd.to_numeric(snapshot["Time"], errors="coerce")
@@ -493,8 +565,45 @@ class Snapshot:
         # Remove columns that contain "Not supported"
         snapshot = self._remove_unsupported_pids(snapshot)
 
+        # Store all-number columns as (32-bit) numbers, so charts don't have to convert them on every plot
+        self._convert_numeric_columns(snapshot)
+
         return snapshot
 
+    def _convert_numeric_columns(self, snapshot: pd.DataFrame) -> None:
+        """
+        Convert text (object) columns that hold only numbers to numeric dtypes, then
+        store PID columns in smaller dtypes wherever that loses nothing:
+        - float64 columns of whole numbers without gaps become int64
+        - other float64 columns become float32 only if every value survives the round trip
+        - int64 columns become int32 when every value fits
+        Columns with gaps (NaN) stay float64, which holds integers exactly up to 2**53.
+        Columns with any non-numeric text, and the PIDs in _TEXT_PIDS, are left as they are.
+        Frame and Time keep their 64-bit dtypes. Modifies the DataFrame in-place.
+        """
+        converted = {}
+        # By position, so duplicated column names are handled one column at a time
+        for i, (name, dtype) in enumerate(zip(snapshot.columns, snapshot.dtypes)):
+            if name in _TEXT_PIDS:
+                continue
+            values = snapshot.iloc[:, i]
+            if dtype == object:
+                try:
+                    values = pd.to_numeric(values)
+                except (ValueError, TypeError):
+                    continue
+            if name not in ("Frame", "Time") and len(values):
+                if values.dtype == np.float64:
+                    values = _narrow_float_column(values)
+                if values.dtype == np.int64 and (
+                    _INT32.min <= values.min() and values.max() <= _INT32.max
+                ):
+                    values = values.astype(np.int32)
+            if values.dtype != dtype:
+                converted[i] = values
+        for i, values in converted.items():
+            snapshot.isetitem(i, values)
+
     def _remove_unsupported_pids(self, snapshot: pd.DataFrame) -> pd.DataFrame:
         """
         Remove columns that contain 'Not supported' values.
@@ -533,16 +642,66 @@ class Snapshot:
 
 
 # Module-level helper functions
-def _to_str(cell) -> str:
-    """Convert any cell to a cleaned string, treating NaN/None as empty."""
-    if cell is None:
-        return ""
-    if isinstance(cell, float) and math.isnan(cell):
-        return ""
-    s = str(cell).strip()
-    return "" if s.lower() in ("nan", "none") else s
+def snapshot_file_key(path: str) -> Tuple[str, float]:
+    """(absolute path, modification time) - identifies one version of a snapshot file."""
+    return (os.path.abspath(path), os.path.getmtime(path))
+
+def parse_snapshot_ts(value):
+    """
+    Parse a snapshot timestamp such as 'Nov 21 2025/13.20.57'.
+    Accepts a single string or a Series; raises ValueError if the format doesn't match.
+    """
+    if isinstance(value, pd.Series):
+        # Split every timestamp into its six fields in one vectorized call
+        parts = value.astype(str).str.strip().str.extract(f"^{_TS_RE.pattern}$")
+        months = parts[0].str.title().map(_MONTHS)
+        if parts.isna().any().any() or months.isna().any():
+            raise ValueError("Series contains values that are not snapshot timestamps")
+        fields = parts.drop(columns=0).astype(int)
+        return pd.to_datetime(pd.DataFrame({
+            "year": fields[2], "month": months.astype(int), "day": fields[1],
+            "hour": fields[3], "minute": fields[4], "second": fields[5],
+        }))
+
+    match = _TS_RE.fullmatch(str(value).strip())
+    month = _MONTHS.get(match[1].title()) if match else None
+    if month is None:
+        raise ValueError(f"Not a snapshot timestamp: {value!r}")
+    return pd.Timestamp(datetime(
+        int(match[3]), month, int(match[2]), int(match[4]), int(match[5]), int(match[6])
+    ))
+
+def _normalize_array(arr: np.ndarray) -> np.ndarray:
+    """Convert a row slice of cells to cleaned strings, treating NaN/None as empty."""
+    s = pd.Series(arr, dtype="string").str.strip()
+    s = s.mask(s.str.lower().isin(["nan", "none"]), "")
+    return s.fillna("").to_numpy()
+
+def _normalized_block(rows: pd.DataFrame) -> np.ndarray:
+    """Stripped, lowercased string array of the given rows, for header keyword matching."""
+    return np.char.lower(np.char.strip(rows.to_numpy(dtype=str)))
+
+def _narrow_float_column(values: pd.Series) -> pd.Series:
+    """float64 column as int64 or float32 if it converts without losing a value, otherwise unchanged."""
+    arr = values.to_numpy()
+    if np.isfinite(arr).all() and (np.abs(arr) < _FLOAT_EXACT_INT).all() and (arr == np.floor(arr)).all():
+        return values.astype(np.int64)
+    narrowed = arr.astype(np.float32)
+    if np.array_equal(narrowed.astype(np.float64), arr, equal_nan=True):
+        return pd.Series(narrowed, index=values.index, name=values.name)
+    return values
+
+def _first_snap_type(matches) -> SnapType:
+    """SnapType for the first PID_KEY keyword (in PID_KEY order) found in matches."""
+    return next(st for pattern, st in PID_KEY.items() if pattern in matches)
 
 def _within(df: pd.DataFrame, r: int) -> bool:
     """True if r is a valid row index for df."""
     return 0 <= r < len(df)
-  
\ No newline at end of file
+  
+def _first_frame_zero(df: pd.DataFrame) -> Optional[int]:
+    """Row position of the first Frame == 0 row, or None if there isn't one."""
+    mask = df["Frame"].to_numpy() == 0
+    if not mask.any():
+        return None
+    return int(mask.argmax())
@@ -7,7 +7,7 @@ Exports all charts from the cart to a multi-page PDF document.
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.figure import Figure
 from ui.chart_renderer import ChartRenderer
-from typing import List
+from typing import Callable, List, Optional
 from domain.chart_config import ChartConfig
 from version import APP_VERSION
 
@@ -24,7 +24,8 @@ class ChartCartPdfExporter:
         """
         self.configs = configs
     
-    def export(self, filepath: str, page_size: tuple = (11, 8.5), dpi: int = 150):
+    def export(self, filepath: str, page_size: tuple = (11, 8.5), dpi: int = 150,
+               on_page_finished: Optional[Callable[[int, int], None]] = None):
         """
         Export all charts to a PDF file, one chart per page.
         
@@ -32,132 +33,111 @@ class ChartCartPdfExporter:
             filepath: Path to save the PDF file
             page_size: Page size in inches (width, height). Default is landscape letter size.
             dpi: Resolution for the PDF. Default is 150.
+            on_page_finished: Optional callback(page_number, page_count) called after each
+                page is written and its figure released
         """
-        if not self.configs:
-            raise ValueError("No charts to export. Chart cart is empty.")
-        
-        with PdfPages(filepath) as pdf:
-            for i, config in enumerate(self.configs, start=1):
-                # Create a new figure for each chart
-                fig = Figure(figsize=page_size, dpi=dpi)
-                
-                # Create axes based on whether we have secondary axis
-                ax_left = fig.add_subplot(111)
-                ax_right = None
-                if config.secondary_axis.series:
-                    ax_right = ax_left.twinx()
-                
-                # Render the chart
-                renderer = ChartRenderer(config)
-                
-                # Render based on chart type
-                if config.chart_type == "line":
-                    renderer._render_line_chart(ax_left, ax_right, config.data)
-                elif config.chart_type == "bar":
-                    renderer._render_bar_chart(ax_left, ax_right, config.data)
-                elif config.chart_type == "bubble":
-                    renderer._render_bubble_chart(ax_left, ax_right, config.data)
-                elif config.chart_type == "status":
-                    renderer._render_status_chart(ax_left, ax_right, config.data)
-                
-                # Apply formatting (axis labels, limits, grid, legends)
-                renderer._apply_formatting(ax_left, ax_right)
-                
-                # Set the chart title
-                ax_left.set_title(config.title, fontsize=14, fontweight='bold', pad=15)
-                
-                # Add chain of custody metadata at the top
-                metadata_parts = []
-                if config.file_name:
-                    metadata_parts.append(f"File: {config.file_name}")
-                if config.date_time:
-                    metadata_parts.append(f"Date/Time: {config.date_time}")
-                if config.engine_hours is not None and config.engine_hours > 0:
-                    metadata_parts.append(f"Engine Hours: {config.engine_hours}")
-                
-                if metadata_parts:
-                    metadata_text = "  |  ".join(metadata_parts)
-                    fig.text(0.5, 0.98, metadata_text, 
-                            ha='center', va='top', fontsize=8, color='gray', style='italic')
-                
-                # Add page number at the bottom
-                fig.text(0.5, 0.02, f'Page {i} of {len(self.configs)}', 
-                        ha='center', va='bottom', fontsize=8, color='gray')
-                
-                # Add watermark
-                fig.text(0.99, 0.01, f'Snapshot Decoder {APP_VERSION}', 
-                        ha='right', va='bottom', fontsize=10, color='lightgray', alpha=0.7)
-                
-                # Adjust layout to prevent overlapping
-                fig.tight_layout(rect=[0, 0.03, 1, 0.96])  # Leave space for page number, title, and metadata
-                
-                # Save the figure to the PDF
-                pdf.savefig(fig, dpi=dpi)
-                
-                # Close the figure to free memory
-                fig.clf()
-                del fig
+        self.export_with_metadata(filepath, None, page_size=page_size, dpi=dpi,
+                                  on_page_finished=on_page_finished)
     
-    def export_with_metadata(self, filepath: str, metadata: dict = None, **kwargs):
+    def export_with_metadata(self, filepath: str, metadata: dict = None, page_size: tuple = (11, 8.5),
+                             dpi: int = 150, on_page_finished: Optional[Callable[[int, int], None]] = None):
         """
         Export charts to PDF with custom metadata.
         
+        Pages are built and written one at a time - each figure is cleared as soon as
+        it has been saved, so only a single page is held in memory however big the cart is.
+        
         Args:
             filepath: Path to save the PDF file
             metadata: Dictionary with PDF metadata (Title, Author, Subject, Keywords, Creator)
-            **kwargs: Additional arguments passed to export()
+            page_size: Page size in inches (width, height). Default is landscape letter size.
+            dpi: Resolution for the PDF. Default is 150.
+            on_page_finished: Optional callback(page_number, page_count) called after each
+                page is written and its figure released
         """
         if not self.configs:
             raise ValueError("No charts to export. Chart cart is empty.")
         
+        page_count = len(self.configs)
         with PdfPages(filepath, metadata=metadata) as pdf:
-            # Use the same export logic
             for i, config in enumerate(self.configs, start=1):
-                fig = Figure(figsize=kwargs.get('page_size', (11, 8.5)), 
-                           dpi=kwargs.get('dpi', 150))
-                
-                ax_left = fig.add_subplot(111)
-                ax_right = None
-                if config.secondary_axis.series:
-                    ax_right = ax_left.twinx()
-                
-                renderer = ChartRenderer(config)
+                fig = self._build_page(config, i, page_count, page_size, dpi)
                 
-                if config.chart_type == "line":
-                    renderer._render_line_chart(ax_left, ax_right, config.data)
-                elif config.chart_type == "bar":
-                    renderer._render_bar_chart(ax_left, ax_right, config.data)
-                elif config.chart_type == "bubble":
-                    renderer._render_bubble_chart(ax_left, ax_right, config.data)
-                elif config.chart_type == "status":
-                    renderer._render_status_chart(ax_left, ax_right, config.data)
+                # Layout is already fixed by tight_layout - skip the bbox_inches='tight' re-measure
+                pdf.savefig(fig, dpi=dpi, bbox_inches=None)
                 
-                renderer._apply_formatting(ax_left, ax_right)
-                ax_left.set_title(config.title, fontsize=14, fontweight='bold', pad=15)
-                                
-                # Add chain of custody metadata at the top
-                metadata_parts = []
-                if config.file_name:
-                    metadata_parts.append(f"File: {config.file_name}")
-                if config.date_time:
-                    metadata_parts.append(f"Date/Time: {config.date_time}")
-                if config.engine_hours is not None and config.engine_hours > 0:
-                    metadata_parts.append(f"Engine Hours: {config.engine_hours}")
-                
-                if metadata_parts:
-                    metadata_text = "  |  ".join(metadata_parts)
-                    fig.text(0.5, 0.98, metadata_text, 
-                            ha='center', va='top', fontsize=8, color='gray', style='italic')
-                
-                fig.text(0.5, 0.02, f'Page {i} of {len(self.configs)}', 
-                        ha='center', va='bottom', fontsize=8, color='gray')
-                
-                # Add watermark
-                fig.text(0.99, 0.01, f'Snapshot Decoder {APP_VERSION}', 
-                        ha='right', va='bottom', fontsize=10, color='lightgray', alpha=0.7)
-                
-                fig.tight_layout(rect=[0, 0.03, 1, 0.96])
-                
-                pdf.savefig(fig, dpi=kwargs.get('dpi', 150))
+                # Close the figure to free memory before the next page is built
                 fig.clf()
                 del fig
+                
+                if on_page_finished is not None:
+                    on_page_finished(i, page_count)
+    
+    def _build_page(self, config: ChartConfig, page_number: int, page_count: int,
+                    page_size: tuple, dpi: int) -> Figure:
+        """
+        Build the figure for one page of the PDF.
+        
+        Args:
+            config: Chart to draw on this page
+            page_number: 1-based page number shown in the footer
+            page_count: Total number of pages shown in the footer
+            page_size: Page size in inches (width, height)
+            dpi: Figure resolution
+            
+        Returns:
+            The rendered Figure, ready to be saved
+        """
+        fig = Figure(figsize=page_size, dpi=dpi)
+        
+        # Create axes based on whether we have secondary axis
+        ax_left = fig.add_subplot(111)
+        ax_right = None
+        if config.secondary_axis.series:
+            ax_right = ax_left.twinx()
+        
+        # Render the chart
+        renderer = ChartRenderer(config)
+        
+        # Render based on chart type
+        if config.chart_type == "line":
+            renderer._render_line_chart(ax_left, ax_right, config.data)
+        elif config.chart_type == "bar":
+            renderer._render_bar_chart(ax_left, ax_right, config.data)
+        elif config.chart_type == "bubble":
+            renderer._render_bubble_chart(ax_left, ax_right, config.data)
+        elif config.chart_type == "status":
+            renderer._render_status_chart(ax_left, ax_right, config.data)
+        
+        # Apply formatting (axis labels, limits, grid, legends)
+        renderer._apply_formatting(ax_left, ax_right)
+        
+        # Set the chart title
+        ax_left.set_title(config.title, fontsize=14, fontweight='bold', pad=15)
+        
+        # Add chain of custody metadata at the top
+        metadata_parts = []
+        if config.file_name:
+            metadata_parts.append(f"File: {config.file_name}")
+        if config.date_time:
+            metadata_parts.append(f"Date/Time: {config.date_time}")
+        if config.engine_hours is not None and config.engine_hours > 0:
+            metadata_parts.append(f"Engine Hours: {config.engine_hours}")
+        
+        if metadata_parts:
+            metadata_text = "  |  ".join(metadata_parts)
+            fig.text(0.5, 0.98, metadata_text, 
+                    ha='center', va='top', fontsize=8, color='gray', style='italic')
+        
+        # Add page number at the bottom
+        fig.text(0.5, 0.02, f'Page {page_number} of {page_count}', 
+                ha='center', va='bottom', fontsize=8, color='gray')
+        
+        # Add watermark
+        fig.text(0.99, 0.01, f'Snapshot Decoder {APP_VERSION}', 
+                ha='right', va='bottom', fontsize=10, color='lightgray', alpha=0.7)
+        
+        # Adjust layout to prevent overlapping
+        fig.tight_layout(rect=[0, 0.03, 1, 0.96])  # Leave space for page number, title, and metadata
+        
+        return fig
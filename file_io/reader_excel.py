@@ -1,9 +1,15 @@
+import importlib.util
+
 import pandas as pd
 
-# Use the Pandas openpyxl engine to read the Excel file
+# The Rust-based calamine reader parses large workbooks several times faster than openpyxl.
+# It is optional (pip install python-calamine) - without it, openpyxl is used as before
+XLSX_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+
+# Use the Pandas calamine engine (or openpyxl if it isn't installed) to read the Excel file
 def load_xlsx(path: str) -> pd.DataFrame:
     '''Read the file as XLSX and return a DataFrame'''
-    return pd.read_excel(path, header=None, engine="openpyxl")
+    return pd.read_excel(path, header=None, engine=XLSX_ENGINE)
 
 
 # Read the file as UTF-16 and return a DataFrame
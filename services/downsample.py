@@ -0,0 +1,128 @@
+"""
+Line Downsampling
+
+Largest-Triangle-Three-Buckets (LTTB) reduction of line series, so charts of long
+snapshots draw a few thousand points instead of every frame while keeping the
+visual shape (peaks and dips) intact. On/off status strips are reduced to the
+edges of each run, which loses nothing.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from domain.chart_config import ChartConfig
+
+# Only reduce when a series has more than this many points per pixel of canvas width
+DOWNSAMPLE_TRIGGER_RATIO = 4
+# Reduced series keep this many points per pixel of canvas width
+DOWNSAMPLE_POINTS_PER_PIXEL = 2
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Return the indices of the points LTTB keeps when reducing (x, y) to n_out points.
+
+    The first and last points are always kept. NaNs in y count as 0 when picking
+    points, so gaps in the data don't stop a bucket from being represented.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+
+    # Interior points split into n_out - 2 nearly equal buckets
+    buckets = np.array_split(np.arange(1, n - 1), n_out - 2)
+    bucket_means = [(x[b].mean(), y[b].mean()) for b in buckets]
+    bucket_means.append((x[-1], y[-1]))
+
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i, bucket in enumerate(buckets):
+        cx, cy = bucket_means[i + 1]
+        # Twice the triangle area between the last kept point, each candidate, and the next bucket's mean
+        area = np.abs((x[a] - cx) * (y[bucket] - y[a]) - (x[a] - x[bucket]) * (cy - y[a]))
+        a = bucket[np.argmax(area)]
+        keep[i + 1] = a
+    return keep
+
+
+def run_edge_indices(states: np.ndarray) -> np.ndarray:
+    """
+    Return the indices of the first and last point of every run of equal values.
+
+    For on/off signals drawn as blocks this is a lossless reduction: the blocks
+    span exactly the same x ranges, with a handful of points per state change
+    instead of one per frame.
+    """
+    n = len(states)
+    if n <= 2:
+        return np.arange(n)
+    changed = states[1:] != states[:-1]
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    keep[1:] |= changed   # first point of a run
+    keep[:-1] |= changed  # last point of a run
+    return np.flatnonzero(keep)
+
+
+def downsample_for_width(
+    config: ChartConfig,
+    data: pd.DataFrame,
+    width_px: int,
+    cache: Optional[Dict[Tuple[str, Optional[str]], tuple]] = None,
+) -> Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+    """
+    LTTB-reduce each line series in data to about DOWNSAMPLE_POINTS_PER_PIXEL * width_px points.
+
+    Returns {series: (x, y)} ready to hand to Axes.plot, or None when the data is
+    already small enough (or the chart isn't a line chart) and should be drawn as-is.
+
+    cache, if given, maps (series, x column) to the last (point count, x, y) reduced for
+    it, so replotting a series at the same canvas width skips the reduction. One entry
+    per series is kept - a new width replaces it. Like the numeric cache in
+    prepare_plot_data, the caller must start a new one whenever the snapshot's
+    columns change.
+    """
+    if config.chart_type != "line" or width_px <= 1:
+        return None
+    if len(data) <= DOWNSAMPLE_TRIGGER_RATIO * width_px:
+        return None
+
+    x_key = config.get_x_column()
+    if x_key:
+        x = data[x_key]
+        if pd.api.types.is_timedelta64_dtype(x):
+            # Same conversion the renderer applies before plotting
+            x = x.dt.total_seconds()
+        elif not pd.api.types.is_numeric_dtype(x):
+            return None
+        x = x.to_numpy(dtype=float)
+    else:
+        x = data.index.to_numpy()
+
+    n_out = DOWNSAMPLE_POINTS_PER_PIXEL * width_px
+    reduced = {}
+    for series_name in config.primary_axis.series + config.secondary_axis.series:
+        if series_name not in data.columns:
+            continue
+        key = (series_name, x_key)
+        if cache is not None:
+            hit = cache.get(key)
+            if hit is not None and hit[0] == n_out:
+                reduced[series_name] = hit[1:]
+                continue
+        values = data[series_name]
+        if not isinstance(values, pd.Series):
+            continue  # duplicated column name - let the renderer handle it
+        y = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+        keep = lttb_indices(x, y, n_out)
+        reduced[series_name] = (x[keep], y[keep].astype(np.float32))
+        if cache is not None:
+            cache[key] = (n_out, *reduced[series_name])
+    return reduced
@@ -0,0 +1,52 @@
+"""
+Plot Data Preparation
+
+Builds the numeric frame a chart is drawn from. This is plain pandas/numpy work
+with no Tk or matplotlib calls, so it is safe to run on a background thread.
+"""
+
+from typing import Dict, Optional
+
+import pandas as pd
+
+from domain.chart_config import ChartConfig
+
+
+def prepare_plot_data(
+    config: ChartConfig, numeric_cache: Optional[Dict[str, pd.Series]] = None
+) -> pd.DataFrame:
+    """
+    Return config.data with every non-numeric column coerced to numbers.
+
+    The renderers call pd.to_numeric on each series anyway; doing it here means
+    that call is a no-op by the time the main thread draws. Numeric columns keep
+    their dtype - Snapshot already stores them as narrow as they go without losing
+    a value.
+
+    numeric_cache, if given, maps a column name to an already converted column of
+    the same snapshot, so replotting a series doesn't convert it again. The caller
+    must start a new cache whenever the snapshot's columns change.
+    """
+    data = config.data
+    converted = {}
+    for col in data.columns.unique():
+        if numeric_cache is not None and col in numeric_cache:
+            converted[col] = numeric_cache[col]
+            continue
+        values = data[col]
+        # Duplicate column names return a DataFrame - leave those to the renderer
+        if not isinstance(values, pd.Series):
+            continue
+        if pd.api.types.is_numeric_dtype(values):
+            continue
+        new_values = pd.to_numeric(values, errors="coerce")
+        converted[col] = new_values
+        if numeric_cache is not None:
+            numeric_cache[col] = new_values
+    if not converted:
+        return data
+    # Shallow copy - unconverted columns are shared with config.data, not duplicated
+    prepared = data.copy(deep=False)
+    for col, values in converted.items():
+        prepared[col] = values
+    return prepared
@@ -6,9 +6,11 @@ Tests the chart rendering system with various configurations.
 
 import unittest
 import pandas as pd
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
 
 from domain.chart_config import ChartConfig, AxisConfig, SeriesStyle
+from domain.pid_info import PidInfo
 from ui.chart_renderer import ChartRenderer
 
 
@@ -102,6 +104,38 @@ class TestChartRenderer(unittest.TestCase):
         self.assertAlmostEqual(ylim[0], 15, places=1)
         self.assertAlmostEqual(ylim[1], 30, places=1)
     
+    def test_apply_axis_limits_to_drawn_bar_chart(self):
+        """Test limits can be moved and reset on a drawn bar chart without re-rendering it."""
+        config = ChartConfig(
+            data=self.test_data.iloc[::5],
+            chart_type="bar",
+            primary_axis=AxisConfig(series=['Temperature'])
+        )
+        ax_left, ax_right = ChartRenderer(config).render(Figure(figsize=(8, 6)))
+        auto_ylim = ax_left.get_ylim()
+        
+        config.primary_axis.auto_scale = False
+        config.primary_axis.min_value, config.primary_axis.max_value = 0, 100
+        ChartRenderer(config).apply_axis_limits(ax_left, ax_right)
+        self.assertEqual(ax_left.get_ylim(), (0, 100))
+        
+        config.primary_axis.auto_scale = True
+        ChartRenderer(config).apply_axis_limits(ax_left, ax_right)
+        self.assertEqual(ax_left.get_ylim(), auto_ylim)
+    
+    def test_apply_axis_limits_keeps_status_strips(self):
+        """Test auto-scaling a status chart restores its fixed strip limits."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="status",
+            primary_axis=AxisConfig(series=['Temperature', 'Flow']),
+            show_legend=False
+        )
+        ax_left, ax_right = ChartRenderer(config).render(Figure(figsize=(8, 6)))
+        ax_left.set_ylim(0, 1)
+        ChartRenderer(config).apply_axis_limits(ax_left, ax_right)
+        self.assertEqual(ax_left.get_ylim(), (-0.5, 3.5))
+    
     def test_auto_x_detection(self):
         """Test automatic X-axis column detection."""
         config = ChartConfig(
@@ -113,6 +147,22 @@ class TestChartRenderer(unittest.TestCase):
         x_col = config.get_x_column()
         self.assertEqual(x_col, 'Time')
     
+    def test_x_range_cached_per_data(self):
+        """Test the X range is computed once per data frame and refreshed when data changes."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature'])
+        )
+        self.assertEqual(config.get_x_range(), (0.0, 49.0))
+        self.assertIs(config._x_range_cache[0], self.test_data)
+        
+        config.data = pd.DataFrame({'Time': pd.to_timedelta([5, 90], unit='s'), 'Temperature': [1, 2]})
+        self.assertEqual(config.get_x_range(), (5.0, 90.0))
+        # Timedelta X values are converted to seconds once and reused
+        self.assertEqual(list(config.x_numeric()), [5.0, 90.0])
+        self.assertIs(config.x_numeric(), config.x_numeric())
+    
     def test_pid_unit_labels(self):
         """Test automatic unit label detection from PID info."""
         config = ChartConfig(
@@ -120,8 +170,8 @@ class TestChartRenderer(unittest.TestCase):
             chart_type="line",
             primary_axis=AxisConfig(series=['Temperature']),
             pid_info={
-                'Temperature': {'Unit': '°C'},
-                'Pressure': {'Unit': 'kPa'}
+                'Temperature': PidInfo(unit='°C'),
+                'Pressure': PidInfo(unit='kPa')
             }
         )
         
@@ -162,6 +212,178 @@ class TestChartRenderer(unittest.TestCase):
         
         self.assertIsNotNone(ax_left)
     
+    def test_update_reuses_axes(self):
+        """Test update redraws into the existing axes pair and falls back when it can't."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature']),
+            secondary_axis=AxisConfig(series=['Pressure'])
+        )
+        fig = Figure(figsize=(8, 6))
+        ax_left, ax_right = ChartRenderer(config).render(fig)
+        
+        config.primary_axis.series = ['Flow']
+        new_left, new_right = ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertIs(new_left, ax_left)
+        self.assertIs(new_right, ax_right)
+        self.assertEqual(len(ax_left.lines), 1)
+        self.assertEqual(ax_right.yaxis.get_label_position(), "right")
+        
+        # A hidden axes (the parked slider) doesn't force a rebuild
+        fig.add_axes([0.15, 0.05, 0.7, 0.03]).set_visible(False)
+        new_left, new_right = ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertIs(new_left, ax_left)
+        
+        # Dropping the secondary series needs a different axes layout - full render
+        config.secondary_axis.series = []
+        new_left, new_right = ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertIsNot(new_left, ax_left)
+        self.assertIsNone(new_right)
+    
+    def test_update_refreshes_existing_lines(self):
+        """Test an update with the same series keeps the Line2D objects and swaps their data."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature'])
+        )
+        fig = Figure(figsize=(8, 6))
+        ax_left, ax_right = ChartRenderer(config).render(fig)
+        line = ax_left.lines[0]
+        
+        config.data = self.test_data.head(10)
+        ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertIs(ax_left.lines[0], line)
+        self.assertEqual(len(line.get_xdata()), 10)
+    
+    def test_update_after_bar_chart_redraws(self):
+        """Test a line update into axes holding a bar chart clears the bars instead of drawing over them."""
+        bar_config = ChartConfig(
+            data=pd.DataFrame({'Band': ['Low', 'High'], 'Hours': [1.0, 2.0]}),
+            chart_type="bar",
+            primary_axis=AxisConfig(series=['Hours']),
+            x_column='Band'
+        )
+        fig = Figure(figsize=(8, 6))
+        ax_left, ax_right = ChartRenderer(bar_config).render(fig)
+        self.assertTrue(ax_left.patches)
+        
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature', 'Flow'])
+        )
+        ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertEqual(len(ax_left.patches), 0)
+        self.assertEqual(len(ax_left.texts), 0)
+        self.assertEqual([line.get_gid() for line in ax_left.lines], ['Temperature', 'Flow'])
+    
+    def test_update_keeps_unchanged_legend(self):
+        """Test the legend is reused when the lines are unchanged and rebuilt when they change."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature'])
+        )
+        fig = Figure(figsize=(8, 6))
+        ax_left, ax_right = ChartRenderer(config).render(fig)
+        legend = ax_left.get_legend()
+        
+        config.data = self.test_data.head(10)
+        ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertIs(ax_left.get_legend(), legend)
+        
+        config.primary_axis.series = ['Temperature', 'Flow']
+        ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertIsNot(ax_left.get_legend(), legend)
+        self.assertEqual(len(ax_left.get_legend().get_texts()), 2)
+    
+    def test_update_adds_and_removes_lines_per_series(self):
+        """Test an update keeps the lines of series still shown and only adds/removes the others."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature', 'Pressure'])
+        )
+        fig = Figure(figsize=(8, 6))
+        ax_left, ax_right = ChartRenderer(config).render(fig)
+        temperature = ax_left.lines[0]
+        
+        config.primary_axis.series = ['Temperature', 'Flow']
+        ChartRenderer(config).update(fig, ax_left, ax_right)
+        self.assertEqual([line.get_gid() for line in ax_left.lines], ['Temperature', 'Flow'])
+        self.assertIs(ax_left.lines[0], temperature)
+    
+    def test_update_colors_match_fresh_render(self):
+        """Test lines kept through an update get the same colours as a fresh render of the same series."""
+        data = self.test_data.assign(Speed=range(50))
+        config = ChartConfig(
+            data=data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature', 'Pressure', 'Flow'])
+        )
+        fig = Figure(figsize=(8, 6))
+        ax_left, ax_right = ChartRenderer(config).render(fig)
+        
+        config.primary_axis.series = ['Temperature', 'Flow', 'Speed']
+        ChartRenderer(config).update(fig, ax_left, ax_right)
+        fresh_left, _ = ChartRenderer(config).render(Figure(figsize=(8, 6)))
+        self.assertEqual(
+            [to_rgba(line.get_color()) for line in ax_left.lines],
+            [to_rgba(line.get_color()) for line in fresh_left.lines]
+        )
+    
+    def test_line_thumbnail_uses_one_collection_per_axis(self):
+        """Test a line chart thumbnail draws its series as one LineCollection per axis."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature', 'Flow']),
+            secondary_axis=AxisConfig(series=['Pressure'])
+        )
+        fig = ChartRenderer(config).render_thumbnail()
+        ax_left, ax_right = fig.axes
+        self.assertEqual(len(ax_left.lines), 0)
+        self.assertEqual(len(ax_left.collections), 1)
+        self.assertEqual(len(ax_left.collections[0].get_segments()), 2)
+        self.assertEqual(len(ax_right.collections), 1)
+        self.assertIsNone(ax_left.get_legend())
+    
+    def test_line_thumbnail_colors_match_full_chart(self):
+        """Test a series with its own colour doesn't shift the cycle colours in a thumbnail."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature', 'Flow']),
+            series_styles={'Temperature': SeriesStyle(color='red')}
+        )
+        ax_left, _ = ChartRenderer(config).render(Figure(figsize=(8, 6)))
+        expected = [to_rgba(line.get_color()) for line in ax_left.lines]
+        thumb_left = ChartRenderer(config).render_thumbnail().axes[0]
+        self.assertEqual([tuple(c) for c in thumb_left.collections[0].get_colors()], expected)
+    
+    def test_render_leaves_config_data_untouched(self):
+        """Test converting a timedelta Time column for plotting doesn't modify config.data."""
+        data = pd.DataFrame({'Time': pd.to_timedelta([0, 1, 2], unit='s'), 'Temperature': [1.0, 2.0, 3.0]})
+        config = ChartConfig(data=data, chart_type="line", primary_axis=AxisConfig(series=['Temperature']))
+        ChartRenderer(config).render(Figure(figsize=(8, 6)))
+        self.assertTrue(pd.api.types.is_timedelta64_dtype(config.data['Time']))
+    
+    def test_clone_sharing_data(self):
+        """Test a clone shares the data frame but not the axis settings."""
+        config = ChartConfig(
+            data=self.test_data,
+            chart_type="line",
+            primary_axis=AxisConfig(series=['Temperature'])
+        )
+        clone = config.clone_sharing_data()
+        self.assertIs(clone.data, config.data)
+        clone.primary_axis.series.append('Flow')
+        clone.primary_axis.min_value = 5.0
+        self.assertEqual(config.primary_axis.series, ['Temperature'])
+        self.assertIsNone(config.primary_axis.min_value)
+    
     def test_invalid_config_raises_error(self):
         """Test that invalid configuration raises error."""
         # Empty data
@@ -0,0 +1,65 @@
+"""
+Unit tests for LTTB line downsampling
+
+Tests the kept indices and the width-based reduction of a chart's series.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from domain.chart_config import ChartConfig, AxisConfig
+from services.downsample import lttb_indices, downsample_for_width, run_edge_indices
+
+
+class TestLttb(unittest.TestCase):
+    """Test cases for lttb_indices and downsample_for_width."""
+
+    def test_keeps_endpoints_and_spike(self):
+        """Test the first, last and an isolated peak point survive reduction."""
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[437] = 50.0
+        keep = lttb_indices(x, y, 20)
+        self.assertEqual(len(keep), 20)
+        self.assertEqual(keep[0], 0)
+        self.assertEqual(keep[-1], 999)
+        self.assertIn(437, keep)
+        self.assertTrue(np.all(np.diff(keep) > 0))
+
+    def test_small_input_is_unchanged(self):
+        """Test asking for more points than exist returns every index."""
+        np.testing.assert_array_equal(lttb_indices(np.arange(5), np.arange(5), 10), np.arange(5))
+
+    def test_downsample_for_width(self):
+        """Test only long line charts are reduced, to two points per pixel."""
+        data = pd.DataFrame({'Time': np.arange(5000.0), 'RPM': np.sin(np.arange(5000.0))})
+        config = ChartConfig(data=data, primary_axis=AxisConfig(series=['RPM']))
+        reduced = downsample_for_width(config, data, 500)
+        x, y = reduced['RPM']
+        self.assertEqual(len(x), 1000)
+        self.assertEqual(len(y), 1000)
+        self.assertIsNone(downsample_for_width(config, data, 2000))
+        config.chart_type = "status"
+        self.assertIsNone(downsample_for_width(config, data, 500))
+
+    def test_downsample_cache(self):
+        """Test a cached reduction is reused at the same width and replaced at a new one."""
+        data = pd.DataFrame({'Time': np.arange(5000.0), 'RPM': np.sin(np.arange(5000.0))})
+        config = ChartConfig(data=data, primary_axis=AxisConfig(series=['RPM']))
+        cache = {}
+        first = downsample_for_width(config, data, 500, cache)
+        second = downsample_for_width(config, data, 500, cache)
+        self.assertIs(second['RPM'][1], first['RPM'][1])
+        downsample_for_width(config, data, 400, cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[('RPM', 'Time')][0], 800)
+
+    def test_run_edges(self):
+        """Test only the first and last point of each on/off run are kept."""
+        states = np.array([0, 0, 0, 1, 1, 1, 1, 0, 0], dtype=bool)
+        self.assertEqual(run_edge_indices(states).tolist(), [0, 2, 3, 6, 7, 8])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Unit tests for plot data preparation
+
+Tests that prepare_plot_data coerces text columns and leaves the rest alone.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from domain.chart_config import ChartConfig, AxisConfig
+from services.plot_data import prepare_plot_data
+
+
+class TestPreparePlotData(unittest.TestCase):
+    """Test cases for prepare_plot_data."""
+
+    def _config(self, data):
+        return ChartConfig(data=data, primary_axis=AxisConfig(series=list(data.columns)))
+
+    def test_text_columns_are_coerced(self):
+        """Test object columns become numeric with bad values as NaN."""
+        data = pd.DataFrame({'Time': [0.0, 1.0, 2.0], 'RPM': ['800', 'x', '1200']})
+        result = prepare_plot_data(self._config(data))
+        self.assertTrue(pd.api.types.is_numeric_dtype(result['RPM']))
+        self.assertEqual(result['RPM'].isna().sum(), 1)
+        # The source frame is not modified
+        self.assertEqual(data['RPM'].dtype, object)
+
+    def test_float_series_keep_their_precision(self):
+        """Test float64 series are plotted as stored, so large counters stay exact."""
+        data = pd.DataFrame({'Time': [0.0, 1.0], 'Counter': [36001999.0, np.nan], 'RPM': ['800', '900']})
+        result = prepare_plot_data(self._config(data))
+        self.assertEqual(result['Counter'].dtype, np.float64)
+        self.assertEqual(result['Counter'].iloc[0], 36001999)
+
+    def test_numeric_data_is_returned_as_is(self):
+        """Test an all-numeric frame is passed through without a copy."""
+        data = pd.DataFrame({'Time': [0.0, 1.0], 'RPM': [800, 900]})
+        self.assertIs(prepare_plot_data(self._config(data)), data)
+
+    def test_numeric_cache_reused(self):
+        """Test converted columns are stored in the cache and reused on the next call."""
+        data = pd.DataFrame({'Time': [0.0, 1.0], 'RPM': ['800', '900']})
+        cache = {}
+        first = prepare_plot_data(self._config(data), cache)
+        self.assertEqual(first['RPM'].tolist(), [800.0, 900.0])
+        self.assertIn('RPM', cache)
+        # A cached column is used instead of converting the text again
+        cache['RPM'] = pd.Series([1.0, 2.0])
+        second = prepare_plot_data(self._config(data[['Time', 'RPM']]), cache)
+        self.assertEqual(second['RPM'].tolist(), [1.0, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+Unit tests for Snapshot parsing helpers
+
+Tests the module-level helpers used while parsing snapshot files.
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from domain import snapshot as snapshot_module
+from domain.snapshot import Snapshot, parse_snapshot_ts
+from domain.snaptypes import SnapType
+from file_io import reader_excel
+
+
+class TestParseSnapshotTs(unittest.TestCase):
+    """Test cases for snapshot timestamp parsing."""
+
+    def test_parse_scalar(self):
+        """Test parsing a single header timestamp."""
+        ts = parse_snapshot_ts("Nov 21 2025/13.20.57")
+        self.assertEqual(ts, pd.Timestamp(2025, 11, 21, 13, 20, 57))
+
+    def test_parse_series(self):
+        """Test parsing a Series of timestamps."""
+        result = parse_snapshot_ts(pd.Series(["Nov 21 2025/13.20.57", "Jan 02 2024/08.05.09"]))
+        self.assertEqual(result.iloc[1], pd.Timestamp(2024, 1, 2, 8, 5, 9))
+
+    def test_parse_month_is_case_insensitive(self):
+        """Test month abbreviations are matched regardless of case."""
+        self.assertEqual(parse_snapshot_ts("NOV 21 2025/13.20.57"), pd.Timestamp(2025, 11, 21, 13, 20, 57))
+
+    def test_parse_rejects_other_formats(self):
+        """Test that non-matching strings raise ValueError."""
+        for text in ("Engine Model", "Foo 21 2025/13.20.57", "Nov 32 2025/13.20.57"):
+            with self.assertRaises(ValueError):
+                parse_snapshot_ts(text)
+        with self.assertRaises(ValueError):
+            parse_snapshot_ts(pd.Series(["Nov 21 2025/13.20.57", "Engine Model"]))
+
+
+class TestHeaderScan(unittest.TestCase):
+    """Test cases for locating the PID header row."""
+
+    def setUp(self):
+        """Set up a raw table with the header on the third row."""
+        self.raw = pd.DataFrame([
+            ["Engine Model", "C4.4", None],
+            [None, None, "Battery voltage"],
+            ["Frame", "Time", " P_L_Battery_Raw "],
+            [None, "s", "V"],
+        ])
+        self.snapshot = Snapshot("test.xlsx")
+
+    def test_find_header_row(self):
+        """Test the first row containing a known keyword is returned."""
+        self.assertEqual(self.snapshot._find_pid_names(self.raw), 2)
+        self.assertEqual(self.snapshot._id_snapshot(self.raw, 2), SnapType.ECU_V1)
+        # The scan result lives on the Snapshot, not in the table's attrs
+        self.assertEqual(self.raw.attrs, {})
+
+    def test_missing_header_row_raises(self):
+        """Test a table without any known keyword raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.snapshot._find_pid_names(self.raw.iloc[:2].copy())
+
+
+class TestNumericColumns(unittest.TestCase):
+    """Test cases for the load-time numeric conversion of PID columns."""
+
+    def test_convert_numeric_columns(self):
+        """Test number columns are stored in smaller dtypes where lossless and text columns are left alone."""
+        df = pd.DataFrame({
+            "Frame": [0.0, 1.0],
+            "Time": ["0.5", "1.0"],
+            "P_L_Battery_Raw": ["12.1", "12.2"],
+            "Engine_Speed": ["800", "801"],
+            "EUD_Engine_run_time_total_nvv": ["5000000000", "5000000001"],
+            "CoETS_stCurrLimActive": ["00101", "00101"],
+            "Status": ["On", "Off"],
+        }, dtype=object)
+        df["Frame"] = df["Frame"].astype(float)
+        Snapshot("test.xlsx")._convert_numeric_columns(df)
+
+        self.assertEqual(df["Time"].dtype, np.float64)
+        # 12.1 has no exact float32 - stays float64
+        self.assertEqual(df["P_L_Battery_Raw"].dtype, np.float64)
+        self.assertEqual(df["Engine_Speed"].dtype, np.int32)
+        # Too large for int32 - stays int64
+        self.assertEqual(df["EUD_Engine_run_time_total_nvv"].dtype, np.int64)
+        self.assertEqual(df["CoETS_stCurrLimActive"].tolist(), ["00101", "00101"])
+        self.assertEqual(df["Status"].dtype, object)
+
+    def test_narrowing_keeps_every_value(self):
+        """Test large counters and decimals come through the numeric conversion unchanged."""
+        df = pd.DataFrame({
+            "Frame": [0.0, 1.0, 2.0],
+            # An .xls snapshot's trailing empty row leaves a gap, so the counter arrives as float64
+            "EUD_Engine_run_time_total_nvv": [36001999.0, 36002001.0, np.nan],
+            "Boost": [11.082, 11.5, 12.0],
+            "Engine_Speed": [849.0, 850.0, 851.0],
+            "Switch": [0.5, 1.0, np.nan],
+        })
+        Snapshot("test.xlsx")._convert_numeric_columns(df)
+
+        # 36001999 is above 2**24, where float32 can't hold every integer
+        self.assertEqual(df["EUD_Engine_run_time_total_nvv"].dtype, np.float64)
+        self.assertEqual(df["EUD_Engine_run_time_total_nvv"].iloc[0], 36001999)
+        self.assertEqual(df["Boost"].dtype, np.float64)
+        self.assertEqual(df["Boost"].iloc[0], 11.082)
+        # Whole numbers without gaps go back to integers
+        self.assertEqual(df["Engine_Speed"].dtype, np.int32)
+        # Values float32 holds exactly are still narrowed
+        self.assertEqual(df["Switch"].dtype, np.float32)
+
+
+@unittest.skipUnless(importlib.util.find_spec("python_calamine"), "python-calamine is not installed")
+class TestXlsxEngines(unittest.TestCase):
+    """Test cases for reading .xlsx snapshots with calamine instead of openpyxl."""
+
+    def setUp(self):
+        """Write a small ECU V1 workbook with text, numbers, dates and empty cells."""
+        handle, self.path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        rows = [
+            ["Nov 21 2025/13.20.57", None, None, None, None, None],
+            ["Engine Model", "C4.4", None, None, None, None],
+            ["Service Date", datetime(2025, 11, 21, 13, 20), None, None, None, None],
+            [None, None, "Battery voltage", "Engine speed", "Run time", "Limit bits"],
+            ["Frame", "Time", "P_L_Battery_Raw", "Engine_Speed", "EUD_Engine_run_time_total_nvv", "CoETS_stCurrLimActive"],
+            [None, "s", "V", "rpm", "s", None],
+        ]
+        for frame in range(-2, 20):
+            rows.append([frame, (frame + 2) * 0.5, 12.0 + frame / 10, 800 + frame, 36001999 + frame, "'00101"])
+        rows.append([None] * 6)
+        pd.DataFrame(rows).to_excel(self.path, header=False, index=False)
+
+    def _load(self, engine):
+        with mock.patch.object(reader_excel, "XLSX_ENGINE", engine):
+            return Snapshot.load(self.path)
+
+    def test_engines_parse_the_same_snapshot(self):
+        """Test calamine and openpyxl give the same parsed snapshot."""
+        expected = self._load("openpyxl")
+        result = self._load("calamine")
+        self.assertEqual(result.snapshot_type, expected.snapshot_type)
+        self.assertEqual(result.header_list, expected.header_list)
+        self.assertEqual(result.date_time, expected.date_time)
+        self.assertEqual(result.hours, expected.hours)
+        self.assertEqual(result.pid_info, expected.pid_info)
+        pd.testing.assert_frame_equal(result.snapshot, expected.snapshot)
+
+
+class TestLoadCache(unittest.TestCase):
+    """Test cases for Snapshot.load_cached."""
+
+    def setUp(self):
+        """Create an empty file to stand in for a snapshot and clear the cache."""
+        handle, self.path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        snapshot_module._LOAD_CACHE.clear()
+        self.addCleanup(snapshot_module._LOAD_CACHE.clear)
+
+    def test_reload_of_unchanged_file_is_not_parsed_again(self):
+        """Test the second load is served from the cache as an independent copy."""
+        with mock.patch.object(Snapshot, "load", side_effect=lambda p: Snapshot(p)) as load:
+            first = Snapshot.load_cached(self.path)
+            first.hours = 12.5
+            second = Snapshot.load_cached(self.path)
+        self.assertEqual(load.call_count, 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.hours, 0.0)
+
+    def test_added_column_stays_in_the_copy(self):
+        """Test a column added to a cached load doesn't show up in the next load."""
+        def fake_load(path):
+            snap = Snapshot(path)
+            snap.snapshot = pd.DataFrame({"Frame": [0.0, 1.0], "RPM": [800.0, 801.0]})
+            return snap
+
+        with mock.patch.object(Snapshot, "load", side_effect=fake_load):
+            first = Snapshot.load_cached(self.path)
+            first.snapshot["Derived"] = first.snapshot["RPM"] * 2
+            second = Snapshot.load_cached(self.path)
+        self.assertNotIn("Derived", second.snapshot.columns)
+        self.assertIsNot(first.snapshot, second.snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Unit tests for shared utility functions
+
+Tests the time conversion helpers with scalar and array input.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from utils import seconds_to_hours, seconds_to_min_sec
+
+
+class TestTimeConversions(unittest.TestCase):
+    """Test cases for seconds_to_hours and seconds_to_min_sec."""
+
+    def test_seconds_to_hours_scalar(self):
+        """Test scalar conversion and rounding."""
+        self.assertEqual(seconds_to_hours(4442400), 1234.0)
+        self.assertEqual(seconds_to_hours(5400, 2), 1.5)
+
+    def test_seconds_to_hours_array(self):
+        """Test Series input is converted element-wise."""
+        result = seconds_to_hours(pd.Series([3600, 5400, 36]), 2)
+        np.testing.assert_array_equal(result, [1.0, 1.5, 0.01])
+
+    def test_seconds_to_min_sec_scalar(self):
+        """Test scalar formatting."""
+        self.assertEqual(seconds_to_min_sec(65.7), "01:05")
+        self.assertEqual(seconds_to_min_sec(0), "00:00")
+
+    def test_seconds_to_min_sec_array(self):
+        """Test array formatting matches the scalar path."""
+        values = np.array([0.0, 59.9, 65.7, 3725.0])
+        result = seconds_to_min_sec(values)
+        self.assertEqual(list(result), [seconds_to_min_sec(v) for v in values])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,11 @@ Main Window
 '''
 
 from __future__ import annotations
-import copy
+import functools
+import itertools
 import os
+import queue
+import threading
 import webbrowser
 
 import tkinter as tk
@@ -13,17 +16,18 @@ from tkinter import ttk, filedialog, messagebox
 from typing import List, Optional
 
 import pandas as pd
+from PIL import Image, ImageTk
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.widgets import Slider
-import mplcursors
 from domain.snaptypes import SnapType
 from domain import quick_charts
 from domain.chart_config import ChartConfig, AxisConfig
 from ui.chart_renderer import ChartRenderer
-from domain.snapshot import Snapshot
-from domain.constants import APP_TITLE, APP_VERSION, UPDATE_URL
+from domain.snapshot import Snapshot, snapshot_file_key
+from domain.constants import APP_TITLE, APP_VERSION, UPDATE_URL, HOVER_ANNOTATION_KWARGS
+from services.plot_data import prepare_plot_data
+from services.downsample import downsample_for_width
 
 # Class to manage Snapshot header information
 from ui.header_panel import HeaderPanel
@@ -34,7 +38,81 @@ from ui.chart_cart import ChartCart
 
 from ui.chart_popup import ChartPopupWindow
 from ui.help_window import HelpWindow
-from utils import resource_path
+from utils import resource_path, seconds_to_min_sec
+
+# Delay before axis limit edits are applied, so a burst of keystrokes syncs only once
+AXIS_SETTING_DEBOUNCE_MS = 150
+
+# Delay after the last keystroke in the PID search box before the list is filtered
+PID_FILTER_DEBOUNCE_MS = 120
+
+# How often the main thread checks for plot data prepared by the worker
+PLOT_POLL_MS = 50
+
+# Delay after the last add/move/remove of a series before the chart is replotted
+PLOT_DEBOUNCE_MS = 50
+
+# How long the mouse must rest over the chart before hover tooltips are wired up
+HOVER_CURSOR_DELAY_MS = 100
+
+def _plot_data_worker(requests: queue.Queue, results: queue.Queue):
+    """Background loop: prepare plot data for each
+    (generation, config, width_px, numeric_cache, downsample_cache) request.
+
+    Only pandas/numpy work happens here - drawing stays on the Tk main thread.
+    """
+    while True:
+        generation, config, width_px, numeric_cache, downsample_cache = requests.get()
+        try:
+            data = prepare_plot_data(config, numeric_cache)
+            reduced = downsample_for_width(config, data, width_px, downsample_cache)
+            results.put((generation, config, data, reduced, None))
+        except Exception as e:
+            results.put((generation, config, None, None, e))
+
+@functools.lru_cache(maxsize=64)
+def _parse_limit_cached(s: str) -> Optional[float]:
+    """Parse an axis limit entry to float, or None if blank/invalid. Memoized on the raw text."""
+    s = s.strip()
+    if not s:
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+# Dispatch table: map quick chart action IDs to handler functions. Built once - it never changes.
+_QUICK_CHART_DISPATCH = {
+    "V1_BATTERY_TEST": quick_charts.V1_show_battery_chart,
+    "V1_RAIL_PRESSURE": quick_charts.V1_show_rail_pressure_chart,
+    "V1_RAIL_GAP": quick_charts.V1_show_rail_gap_chart,
+    "V1_IMV_CURRENT": quick_charts.V1_show_imv_current_chart,
+    "V1_TURBO": quick_charts.V1_show_turbo_chart,
+    "V1_EGR_FLOW": quick_charts.V1_show_EGR_flow_chart,
+    "V1_EGR_POSITION": quick_charts.V1_show_EGR_position_chart,
+    "V1_PISTON_DELTA": quick_charts.V1_show_piston_delta_chart,
+    "V1_CAM_CRANK": quick_charts.V1_show_cam_crank_chart,
+    "V1_START_AID": quick_charts.V1_show_start_aid_chart,
+    "V1_AIR_FUEL_RATIO": quick_charts.V1_show_air_fuel_ratio_chart,
+    "V1_TORQUE_CONTROL": quick_charts.V1_show_torque_control_chart,
+
+    "V1EUD_SPEED_V_LOAD": quick_charts.V1EUD_show_speed_load_chart,
+    "V1EUD_SPEED_BAND": quick_charts.V1EUD_show_speed_band_chart,
+    "V1EUD_ELEVATION": quick_charts.V1EUD_show_elevation_chart,
+    "V1EUD_EGT": quick_charts.V1EUD_show_EGT_chart,
+
+    "V2_BATTERY_TEST": quick_charts.V2_show_battery_chart,
+    "V2_RAIL_PRESSURE": quick_charts.V2_show_rail_pressure_chart,
+    "V2_RAIL_GAP": quick_charts.V2_show_rail_gap_chart,
+    "V2_IMV_CURRENT": quick_charts.V2_show_imv_current_chart,
+    "V2_TURBO": quick_charts.V2_show_turbo_chart,
+    "V2_MISFIRE": quick_charts.V2_show_misfire_chart,
+    "V2_THROTTLE_VALVE": quick_charts.V2_show_throttle_chart,
+    "V2_ENGINE_LOAD": quick_charts.V2_show_load_chart,
+    "V2_ENGINE_TORQUE_LIMITS": quick_charts.V2_show_engine_torque_limits,
+
+    # add more as needed
+}
 
 class SnapshotDecoderApp(tk.Tk):
 
@@ -60,6 +138,26 @@ class SnapshotDecoderApp(tk.Tk):
                 self.iconbitmap(icon_path)
         except Exception:
             pass  # If icon fails to load, continue without it
+
+        # Plot data is prepared on a worker thread and handed back through these queues
+        self._plot_requests: queue.Queue = queue.Queue()
+        self._plot_results: queue.Queue = queue.Queue()
+        self._plot_generation = 0
+        self._plot_poll_job = None
+        # Pending debounced replot after series edits (see _schedule_plot)
+        self._plot_job = None
+        threading.Thread(
+            target=_plot_data_worker, args=(self._plot_requests, self._plot_results), daemon=True
+        ).start()
+
+        # Cart PDF exports also run on a worker thread; the result comes back through this queue
+        self._pdf_export_results: queue.Queue = queue.Queue()
+        self._pdf_export_thread: Optional[threading.Thread] = None
+
+        # Snapshot files are parsed on a worker thread too, so the window keeps repainting
+        self._snapshot_load_results: queue.Queue = queue.Queue()
+        self._snapshot_load_thread: Optional[threading.Thread] = None
+        self._snapshot_load_id = 0
         
         self._initialize_state()
         self._build_ui()
@@ -68,10 +166,30 @@ class SnapshotDecoderApp(tk.Tk):
     def _initialize_state(self):
         '''initialize or reset all app-level parameters'''        
         self.engine: Optional[Snapshot] = None
+        # snapshot_file_key of the loaded file, so reopening the unchanged file can be skipped
+        self._engine_file_key: Optional[tuple] = None
+
+        # Set while variables are reset in bulk so their trace callbacks don't fire for each write
+        self._suspend_traces = False
+        self._index_pid_names()
+
+        # PID search box - filtering waits for a pause in typing, and is skipped if the term is unchanged
+        self._filter_job = None
+        self._last_filter_term: Optional[str] = None
+        # PID names currently in the listbox, in order, so a new filter only touches what differs
+        self._displayed_pids: tuple = ()
+
+        # Any plot still being prepared belongs to the old state - drop it when it arrives
+        self._discard_pending_plot()
+        # Same for a snapshot still being loaded
+        self._snapshot_load_id = getattr(self, "_snapshot_load_id", 0) + 1
 
         # Lists to hold PIDs charted on Primary and Secondary Axis'
         self.primary_series: List[str] = []
         self.secondary_series: List[str] = []
+        # Set mirrors of the lists above for O(1) membership checks - keep them in sync on every change
+        self._primary_set: set[str] = set()
+        self._secondary_set: set[str] = set()
     
         # Axis limits state
         self.primary_min = tk.StringVar()
@@ -99,6 +217,7 @@ class SnapshotDecoderApp(tk.Tk):
         self.chart_type_var = tk.StringVar(value="line")
         
         # Add trace callbacks to sync working_config when axis settings change
+        self._axis_sync_job = None
         self.primary_ymin.trace_add("write", self._on_axis_setting_change)
         self.primary_ymax.trace_add("write", self._on_axis_setting_change)
         self.secondary_ymin.trace_add("write", self._on_axis_setting_change)
@@ -112,12 +231,27 @@ class SnapshotDecoderApp(tk.Tk):
         # Single working config that's always synced with widgets
         self.working_config: Optional[ChartConfig] = None
 
-        # Slider state
+        # (primary, secondary, chart type) of the chart currently drawn, for limit-only updates
+        self._plotted_series: Optional[tuple] = None
+
+        # Chart axes are created by _build_plot_area; the secondary axis is None on charts without one
+        self.ax_left = None
+        self.ax_right = None
+
+        # Chart Table window, while one is open
+        self.chart_table_window = None
+
+        # Slider state - self.slider is only set while a slider is shown; the widget itself is
+        # kept hidden on the figure between charts and re-ranged instead of re-created
         self.slider = None
+        self._slider_widget = None
         self.cursor_line = None
 
-        # Cursor state
+        # Cursor state - the mplcursors cursor is only built once the mouse rests on the chart
         self.mpl_cursor = None
+        self._hover_cid = None
+        self._hover_job = None
+        self._hover_event = None
 
         # Interactivity control
         self.enable_slider = tk.BooleanVar(value=False)
@@ -132,7 +266,6 @@ class SnapshotDecoderApp(tk.Tk):
         self._build_menu()
         self._build_layout()          # uses the variables above
         self._build_plot_area()       # may call _toggle_* which also needs them
-        self._update_controls_state(enabled=False)
 
     def _clear_ui(self):
         """Reset all data and UI components to blank/default."""
@@ -141,6 +274,40 @@ class SnapshotDecoderApp(tk.Tk):
             widget.destroy()
         self._build_ui()
 
+    def _reset_data_only(self):
+        """Drop the loaded snapshot and reset the existing widgets in place, without rebuilding the UI."""
+        self.engine = None
+        self._engine_file_key = None
+        self._index_pid_names()
+        self._discard_pending_plot()
+
+        # Clear the chart first - it resets the series lists, limits, interactivity and axes
+        self.clear_chart()
+        self.custom_series_styles = {}
+        self._suspend_traces = True
+        try:
+            self.chart_type_var.set("line")
+            self.enable_slider.set(False)
+            self.enable_cursor.set(False)
+        finally:
+            self._suspend_traces = False
+
+        # A full rebuild destroys the Chart Table window with everything else; here it has to be
+        # closed by hand, or the next Chart Table request would raise the old snapshot's table
+        if self.chart_table_window is not None:
+            try:
+                self.chart_table_window.destroy()
+            except tk.TclError:
+                pass
+            self.chart_table_window = None
+
+        self.chart_cart.clear()
+        self.search_var.set("")
+        self._show_pids(())
+        self._last_filter_term = None
+        self.header_panel.clear_header_panel()
+        self.toolbar.chart_config = None
+
 #---------------------------------------------------------------------------------------------------------------------
 # ----------------------------------------------- UI Construction ----------------------------------------------------
 #---------------------------------------------------------------------------------------------------------------------
@@ -252,7 +419,7 @@ class SnapshotDecoderApp(tk.Tk):
         self.search_var = tk.StringVar()
         search = ttk.Entry(search_frame, textvariable=self.search_var)
         search.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        search.bind("<KeyRelease>", lambda e: self._filter_pids())
+        search.bind("<KeyRelease>", lambda e: self._schedule_filter())
 
         # All PID Names listbox (multi-select) - row 2 (gets all shrinking priority)
         pid_list_frame = ttk.Frame(left_border)
@@ -375,14 +542,57 @@ class SnapshotDecoderApp(tk.Tk):
 
         if not path:
             return
+
+        # The same file, unchanged since it was loaded, is already open - keep the current charts
+        try:
+            file_key = snapshot_file_key(path)
+        except OSError:
+            file_key = None
+        if self.engine is not None and file_key is not None and file_key == self._engine_file_key:
+            return
+
+        if self._snapshot_load_thread is not None and self._snapshot_load_thread.is_alive():
+            messagebox.showinfo("Load In Progress", "A snapshot is still loading. Please wait for it to finish.")
+            return
         
-        self._clear_ui()
+        self._reset_data_only()
+
+        load_id = self._snapshot_load_id
 
+        def _run():
+            # Parsing is plain pandas work - no Tk calls here
+            try:
+                self._snapshot_load_results.put((load_id, file_key, Snapshot.load_cached(path), None))
+            except Exception as e:
+                self._snapshot_load_results.put((load_id, file_key, None, e))
+
+        # Large workbooks take seconds to parse - load on a worker thread so the window stays responsive
+        self.title(f"{APP_TITLE} {APP_VERSION} - Loading {os.path.basename(path)}…")
+        self.config(cursor="watch")
+        self._snapshot_load_thread = threading.Thread(target=_run, daemon=True)
+        self._snapshot_load_thread.start()
+        self.after(PLOT_POLL_MS, self._check_snapshot_load)
+
+    def _check_snapshot_load(self):
+        """Show the loaded snapshot once the worker thread has finished parsing it."""
         try:
-            self.engine = Snapshot.load(path)
-        except Exception as e:
-            messagebox.showerror("Load failed", f"Couldn't load file.\n\n{e}")
+            load_id, file_key, engine, error = self._snapshot_load_results.get_nowait()
+        except queue.Empty:
+            self.after(PLOT_POLL_MS, self._check_snapshot_load)
+            return
+
+        self._set_window_title()
+        self.config(cursor="")
+
+        # The snapshot was closed (or the UI rebuilt) while it loaded
+        if load_id != self._snapshot_load_id:
+            return
+
+        if error is not None:
+            messagebox.showerror("Load failed", f"Couldn't load file.\n\n{error}")
             return
+        self.engine = engine
+        self._engine_file_key = file_key
 
         self.header_panel.set_header_snaptype(self.engine.snapshot_type)
         
@@ -404,7 +614,6 @@ class SnapshotDecoderApp(tk.Tk):
         self.header_panel.build_quick_chart()  
 
         # Update the UI
-        self._update_controls_state(enabled=True)
         self._populate_pid_list()
 
 #------------------------------------------------------------------------------------------------------------------------------
@@ -417,42 +626,8 @@ class SnapshotDecoderApp(tk.Tk):
         # Diagnostic logging for quick chart actions
         #print(f"[Quick Chart Button Action] {snaptype}: {action_id}")
 
-        # Dispatch table: map action IDs to handler functions
-        dispatch = {
-            "V1_BATTERY_TEST": quick_charts.V1_show_battery_chart,
-            "V1_RAIL_PRESSURE": quick_charts.V1_show_rail_pressure_chart,
-            "V1_RAIL_GAP": quick_charts.V1_show_rail_gap_chart,
-            "V1_IMV_CURRENT": quick_charts.V1_show_imv_current_chart,
-            "V1_TURBO": quick_charts.V1_show_turbo_chart,
-            "V1_EGR_FLOW": quick_charts.V1_show_EGR_flow_chart,
-            "V1_EGR_POSITION": quick_charts.V1_show_EGR_position_chart,
-            "V1_PISTON_DELTA": quick_charts.V1_show_piston_delta_chart,
-            "V1_CAM_CRANK": quick_charts.V1_show_cam_crank_chart,
-            "V1_START_AID": quick_charts.V1_show_start_aid_chart,
-            "V1_AIR_FUEL_RATIO": quick_charts.V1_show_air_fuel_ratio_chart,
-            "V1_TORQUE_CONTROL": quick_charts.V1_show_torque_control_chart,
-
-            "V1EUD_SPEED_V_LOAD": quick_charts.V1EUD_show_speed_load_chart,
-            "V1EUD_SPEED_BAND": quick_charts.V1EUD_show_speed_band_chart,
-            "V1EUD_ELEVATION": quick_charts.V1EUD_show_elevation_chart,
-            "V1EUD_EGT": quick_charts.V1EUD_show_EGT_chart,
-
-            "V2_BATTERY_TEST": quick_charts.V2_show_battery_chart,
-            "V2_RAIL_PRESSURE": quick_charts.V2_show_rail_pressure_chart,
-            "V2_RAIL_GAP": quick_charts.V2_show_rail_gap_chart,
-            "V2_IMV_CURRENT": quick_charts.V2_show_imv_current_chart,
-            "V2_TURBO": quick_charts.V2_show_turbo_chart,
-            "V2_MISFIRE": quick_charts.V2_show_misfire_chart,
-            "V2_THROTTLE_VALVE": quick_charts.V2_show_throttle_chart,
-            "V2_ENGINE_LOAD": quick_charts.V2_show_load_chart,
-            "V2_ENGINE_TORQUE_LIMITS": quick_charts.V2_show_engine_torque_limits
-
-
-            # add more as needed
-        }
-
         # Lookup and call the handler if it exists
-        handler = dispatch.get(action_id)
+        handler = _QUICK_CHART_DISPATCH.get(action_id)
         if handler:
             handler(self, snaptype)  # pass self as main_app
         else:
@@ -462,26 +637,91 @@ class SnapshotDecoderApp(tk.Tk):
 #---------------------------------------------------- PID List Logic ---------------------------------------------------------
 #------------------------------------------------------------------------------------------------------------------------------
 
+    def _index_pid_names(self):
+        """Cache the snapshot's PID names, lowercased once, for search filtering."""
+        names = tuple(self.engine.snapshot.columns) if self.engine else ()
+        lowered = tuple(str(n).lower() for n in names)
+        everything = tuple(zip(names, lowered))
+        # (term, matching (name, lowered) pairs) from the last search, to narrow from while typing
+        last = ("", everything)
+
+        @functools.lru_cache(maxsize=32)
+        def match(term: str) -> tuple:
+            nonlocal last
+            # Anything that contains the new term also contains the previous one, so when the
+            # user keeps typing only the previous matches need scanning
+            prev_term, prev_hits = last
+            candidates = prev_hits if prev_term in term else everything
+            hits = tuple(pair for pair in candidates if term in pair[1])
+            last = (term, hits)
+            return tuple(n for n, _ in hits)
+
+        self._pid_names = names
+        self._match_pids = match
+        # Position of each column in the snapshot, for slicing columns in their stored order
+        self._column_order = {name: i for i, name in enumerate(names)}
+        # Column sliced into every chart as a candidate x axis - the schema is fixed after load
+        self._x_key = "Time" if "Time" in self._column_order else ("Frame" if "Frame" in self._column_order else None)
+        # Columns already converted and series already downsampled for plotting, filled by the
+        # plot worker. The columns just changed, so start new dicts (a plot still in flight
+        # keeps writing to the old ones)
+        self._numeric_cache = {}
+        self._downsample_cache = {}
+
     def _populate_pid_list(self):
-        self.pid_list.delete(0, tk.END)
-        if not self.engine:
-            return
-        for col in self.engine.snapshot.columns:
-            self.pid_list.insert(tk.END, col)
+        self._index_pid_names()
+        self._show_pids(self._pid_names)
+        self._last_filter_term = None  # list shows everything now - the next search must filter
+
+    def refresh_pid_list(self):
+        """Re-read the snapshot's columns (e.g. after a quick chart added some) and re-apply the search."""
+        self._index_pid_names()
+        self._last_filter_term = None
+        # Only the new names are inserted - everything already listed stays put
+        self._filter_pids()
+
+    def _schedule_filter(self):
+        """Filter the PID list once typing pauses, instead of on every keystroke."""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(PID_FILTER_DEBOUNCE_MS, self._filter_pids)
 
     def _filter_pids(self):
+        self._filter_job = None
         term = self.search_var.get().strip().lower()
-        self.pid_list.delete(0, tk.END)
+        # Arrow keys, Shift, etc. also fire KeyRelease - nothing to do if the term is the same
+        if term == self._last_filter_term:
+            return
+        self._last_filter_term = term
         if not self.engine:
+            self._show_pids(())
+            return
+        self._show_pids(self._match_pids(term))
+
+    def _show_pids(self, names: tuple):
+        """Make the PID listbox show names, deleting and inserting only the entries that changed."""
+        old = self._displayed_pids
+        if names == old:
             return
-        cols = [c for c in self.engine.snapshot.columns if term in c.lower()]
-        for c in cols:
-            self.pid_list.insert(tk.END, c)
+        # The unchanged head and tail stay in the listbox; only the middle section is replaced
+        limit = min(len(old), len(names))
+        head = 0
+        while head < limit and old[head] == names[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == names[-1 - tail]:
+            tail += 1
+        if len(old) - tail > head:
+            self.pid_list.delete(head, len(old) - tail - 1)
+        if len(names) - tail > head:
+            self.pid_list.insert(head, *names[head:len(names) - tail])
+        self._displayed_pids = names
 
     def _add_selected(self, target: str):
         if not self.engine:
             return
-        sel = [self.pid_list.get(i) for i in self.pid_list.curselection()]
+        # Selected rows map straight onto the names we put in the listbox - no Tk get() per row
+        sel = [self._displayed_pids[i] for i in self.pid_list.curselection()]
         if not sel:
             return
         
@@ -490,68 +730,79 @@ class SnapshotDecoderApp(tk.Tk):
         if not filtered:
             messagebox.showinfo("Heads up", "Select one or more PID columns (not Frame/Time).")
             return
-
+        self.add_series(target, filtered)
+
+    def add_series(self, target: str, names) -> None:
+        """
+        Append PIDs to the "primary" or "secondary" axis list, skipping ones already there,
+        and replot. The series list, its membership set and the listbox are updated together -
+        other windows should add series through here rather than touching them directly.
+        """
         if target == "primary":
-            for s in filtered:
-                if s not in self.primary_series:
-                    self.primary_series.append(s)
-                    self.primary_list.insert(tk.END, s)
+            series, members, listbox = self.primary_series, self._primary_set, self.primary_list
         else:
-            for s in filtered:
-                if s not in self.secondary_series:
-                    self.secondary_series.append(s)
-                    self.secondary_list.insert(tk.END, s)
+            series, members, listbox = self.secondary_series, self._secondary_set, self.secondary_list
+        added = []
+        for s in names:
+            if s not in members:
+                members.add(s)
+                added.append(s)
+        if not added:
+            return
+        series.extend(added)
+        listbox.insert(tk.END, *added)
 
-        # Sync and redraw chart if snapshot is loaded
-        if self.engine is not None:
-            self._sync_working_config()
-            self.plot_combo_chart()
+        # Redraw once the user pauses - rapid clicks only draw the final state
+        self._schedule_plot()
 
     def _move_in_list(self, listbox: tk.Listbox, delta: int):
         idxs = list(listbox.curselection())
         if not idxs:
             return
-        for idx in idxs:
-            new_idx = max(0, min(listbox.size()-1, idx + delta))
-            if new_idx == idx:
+        # Swap directly in the backing list instead of re-reading the listbox afterwards
+        series = self.primary_series if listbox is self.primary_list else self.secondary_series
+        selected = set(idxs)
+        moved = False
+
+        # Start from the leading edge so a selected block moves together
+        for idx in (reversed(idxs) if delta > 0 else idxs):
+            new_idx = idx + delta
+            if new_idx < 0 or new_idx >= len(series) or new_idx in selected:
                 continue
-            text = listbox.get(idx)
+            series[idx], series[new_idx] = series[new_idx], series[idx]
             listbox.delete(idx)
-            listbox.insert(new_idx, text)
-            listbox.selection_set(new_idx)
+            listbox.insert(new_idx, series[new_idx])
+            selected.discard(idx)
+            selected.add(new_idx)
+            moved = True
 
-        # Mirror to backing lists
-        if listbox is self.primary_list:
-            self.primary_series = list(listbox.get(0, tk.END))
-        else:
-            self.secondary_series = list(listbox.get(0, tk.END))
+        if not moved:
+            return
 
-        # Sync and redraw chart if snapshot is loaded
-        if self.engine is not None:
-            self._sync_working_config()
-            self.plot_combo_chart()
+        # Keep the moved items selected
+        listbox.selection_clear(0, tk.END)
+        for idx in selected:
+            listbox.selection_set(idx)
+
+        # Redraw once the user pauses - rapid clicks only draw the final state
+        self._schedule_plot()
 
     def _remove_selected_from(self, which: str):
         lb = self.primary_list if which == "primary" else self.secondary_list
         sel = list(lb.curselection())
         if not sel:
             return
-        for idx in reversed(sel):
-            lb.delete(idx)
+        # Delete from the backing list and set alongside the listbox instead of re-reading it
         if which == "primary":
-            self.primary_series = list(lb.get(0, tk.END))
+            series, series_set = self.primary_series, self._primary_set
         else:
-            self.secondary_series = list(lb.get(0, tk.END))
-
-        # Sync and redraw chart if snapshot is loaded
-        if self.engine is not None:
-            self._sync_working_config()
-            self.plot_combo_chart()
+            series, series_set = self.secondary_series, self._secondary_set
+        for idx in reversed(sel):
+            lb.delete(idx)
+            series_set.discard(series.pop(idx))
 
-    def _update_controls_state(self, enabled: bool):
-        state = tk.NORMAL if enabled else tk.DISABLED
-        for w in (self.pid_list, self.primary_list, self.secondary_list):
-            w.configure(state=state)
+        # Redraw once the user pauses - rapid clicks only draw the final state
+        self._schedule_plot()
 
     def _toggle_primary_inputs(self):
         st = tk.DISABLED if self.primary_auto.get() else tk.NORMAL
@@ -564,12 +815,40 @@ class SnapshotDecoderApp(tk.Tk):
         self.secondary_max_entry.configure(state=st)
     
     def _on_axis_setting_change(self, *args):
-        """Callback when axis settings change to sync working_config."""
+        """Callback when axis settings change - waits for typing to pause before syncing."""
+        if self._suspend_traces:
+            return
+        if self._axis_sync_job is not None:
+            self.after_cancel(self._axis_sync_job)
+        self._axis_sync_job = self.after(AXIS_SETTING_DEBOUNCE_MS, self._apply_axis_setting_change)
+
+    def _apply_axis_setting_change(self):
+        """Sync working_config with the latest axis settings."""
+        self._axis_sync_job = None
         if self.engine is not None and (self.primary_series or self.secondary_series):
             self._sync_working_config()
+
+            # If the drawn chart still shows the same series as the same chart type, just move its limits
+            current = (tuple(self.primary_series), tuple(self.secondary_series), self.chart_type_var.get())
+            if self._plotted_series == current:
+                self._apply_axis_limits_only()
+
+    def _request_redraw(self):
+        """Queue a canvas redraw, but only if something on the figure actually changed."""
+        # Matplotlib marks the figure stale whenever an artist changes and clears it after a draw,
+        # so a request with nothing new to show doesn't queue another idle draw
+        if self.figure.stale:
+            self.canvas.draw_idle()
+
+    def _apply_axis_limits_only(self):
+        """Update the y-axis limits of the drawn chart without re-rendering its series."""
+        ChartRenderer(self.working_config).apply_axis_limits(self.ax_left, self.ax_right)
+        self._request_redraw()
     
     def _on_chart_type_change(self, *args):
         """Callback when chart type changes to re-render the chart."""
+        if self._suspend_traces:
+            return
         if self.engine is not None and (self.primary_series or self.secondary_series):
             self._sync_working_config()
             self.plot_combo_chart()
@@ -580,16 +859,21 @@ class SnapshotDecoderApp(tk.Tk):
             self.working_config = None
             return
         
-        # Determine x_column
-        x_key = "Time" if "Time" in self.engine.snapshot.columns else ("Frame" if "Frame" in self.engine.snapshot.columns else None)
+        # x column candidate, found once per snapshot in _index_pid_names
+        x_key = self._x_key
         
         # Select only relevant columns for the chart data
         relevant_columns = list(self.primary_series) + list(self.secondary_series)
         if x_key:
             relevant_columns.insert(0, x_key)
+        # Slice in the snapshot's own column order - pandas gathers fewer scattered blocks that way.
+        # The axes keep the user's order through primary_series/secondary_series
+        end = len(self._column_order)
+        relevant_columns.sort(key=lambda c: self._column_order.get(c, end))
         
-        # Create a copy of the data with only relevant columns
-        chart_data = self.engine.snapshot[relevant_columns].copy() if relevant_columns else pd.DataFrame()
+        # Select only the relevant columns - column selection already returns a new frame,
+        # and nothing downstream writes into it, so no extra copy is made
+        chart_data = self.engine.snapshot[relevant_columns] if relevant_columns else pd.DataFrame()
 
         # Configure primary axis
         primary_axis = AxisConfig(
@@ -617,7 +901,7 @@ class SnapshotDecoderApp(tk.Tk):
             chart_type=self.chart_type_var.get(),
             primary_axis=primary_axis,
             secondary_axis=secondary_axis,
-            title=self.ax_left.get_title() if hasattr(self, 'ax_left') else "Chart Area",
+            title=self.ax_left.get_title() if self.ax_left is not None else "Chart Area",
             pid_info=self.engine.pid_info,
             file_name=self.engine.file_name,
             date_time=self.engine.date_time,
@@ -627,20 +911,27 @@ class SnapshotDecoderApp(tk.Tk):
         )
     
     def _parse_limit(self, s: str):
-        s = (s or "").strip()
-        if not s:
-            return None
-        try:
-            return float(s)
-        except ValueError:
-            return None
+        return _parse_limit_cached(s or "")
 
 #------------------------------------------------------------------------------------------------------------------------------
 # ---------------------------------------------------- Plotting ---------------------------------------------------------------
 #------------------------------------------------------------------------------------------------------------------------------
 
-    def plot_combo_chart(self):
-        """Plot chart using the ChartRenderer class."""
+    def _schedule_plot(self):
+        """Replot after PLOT_DEBOUNCE_MS, restarting the wait on every call."""
+        if self._plot_job is not None:
+            self.after_cancel(self._plot_job)
+        self._plot_job = self.after(PLOT_DEBOUNCE_MS, self._run_scheduled_plot)
+
+    def _run_scheduled_plot(self):
+        self._plot_job = None
+        # Sync and redraw chart if snapshot is loaded
+        if self.engine is not None:
+            self._sync_working_config()
+            self.plot_combo_chart()
+
+    def plot_combo_chart(self, title: Optional[str] = None):
+        """Plot chart using the ChartRenderer class. title, if given, replaces the current chart title."""
         if not self.engine:
             messagebox.showinfo("No data", "Open a data file first.")
             return
@@ -654,59 +945,147 @@ class SnapshotDecoderApp(tk.Tk):
         if not self.working_config:
             messagebox.showinfo("No config", "Failed to create chart configuration.")
             return
+        if title:
+            self.working_config.title = title
+
+        # Hand the data prep to the worker thread; the draw happens in _drain_plot_queue
+        self._plot_generation += 1
+        # Canvas width (read here - Tk calls stay on the main thread) sets how far line series are downsampled
+        width_px = self.canvas_widget.winfo_width()
+        # The worker gets its own copy of the config - working_config's series lists keep
+        # changing on this thread while the data is prepared
+        config = self.working_config.clone_sharing_data()
+        self._plot_requests.put(
+            (self._plot_generation, config, width_px, self._numeric_cache, self._downsample_cache)
+        )
+        if self._plot_poll_job is None:
+            self._plot_poll_job = self.after(PLOT_POLL_MS, self._drain_plot_queue)
+
+    def show_custom_chart(self, config: ChartConfig):
+        """Render a chart built outside the series lists (e.g. a quick chart's bar chart)."""
+        # The axes no longer hold the series-list chart, so the next plot must start from scratch
+        self._plotted_series = None
+        self.working_config = config
+        renderer = ChartRenderer(config)
+        self.ax_left, self.ax_right = renderer.render(self.figure, self.canvas)
+        self.toolbar.chart_config = config
+
+    def _discard_pending_plot(self):
+        """Drop any plot still being prepared and stop polling for it."""
+        # Its result will no longer match the generation, so it is thrown away when it arrives
+        self._plot_generation += 1
+        if self._plot_poll_job is not None:
+            self.after_cancel(self._plot_poll_job)
+            self._plot_poll_job = None
+
+    def _drain_plot_queue(self):
+        """Poll for prepared plot data and render the newest result on the main thread."""
+        self._plot_poll_job = None
+        latest = None
+        while True:
+            try:
+                latest = self._plot_results.get_nowait()
+            except queue.Empty:
+                break
+
+        # Keep polling until the result for the most recent request shows up
+        if latest is None or latest[0] != self._plot_generation:
+            self._plot_poll_job = self.after(PLOT_POLL_MS, self._drain_plot_queue)
+            return
+
+        _, config, data, reduced, error = latest
+        if error is not None:
+            messagebox.showerror("Chart Error", f"Failed to render chart: {str(error)}")
+            return
 
         # Render the chart using working_config
         try:
-            renderer = ChartRenderer(self.working_config)
-            self.ax_left, self.ax_right = renderer.render(self.figure, self.canvas)
+            config.data = data
+            config.data_reduced = reduced
+            # Drop the previous chart's cursor and slider before its axes go away
+            self._clear_interactivity()
+            renderer = ChartRenderer(config)
+            if self._plotted_series and self._plotted_series[2] == config.chart_type:
+                # Same kind of chart as the one on screen - redraw into its axes
+                self.ax_left, self.ax_right = renderer.update(self.figure, self.ax_left, self.ax_right, self.canvas)
+            else:
+                self.ax_left, self.ax_right = renderer.render(self.figure, self.canvas)
+            self._plotted_series = (
+                tuple(config.primary_axis.series), tuple(config.secondary_axis.series), config.chart_type
+            )
             
             # Add interactive slider and cursors
             self._add_interactivity()
             
             # Update toolbar with current chart config for PDF export
-            self.toolbar.chart_config = self.working_config
+            self.toolbar.chart_config = config
         except Exception as e:
             messagebox.showerror("Chart Error", f"Failed to render chart: {str(e)}")
 
     def _on_interactivity_change(self, *args):
         """Callback when interactivity options change."""
         # Check if chart is active
-        if not self.working_config:
+        if self._suspend_traces or not self.working_config:
             return
-            
-        self._clear_interactivity()
-        self._add_interactivity()
-        self.canvas.draw_idle()
+
+        # The hover cursor is built at most once per chart - toggling just enables/disables it
+        self._set_cursor_enabled(self.enable_cursor.get())
+
+        # The slider changes the figure layout, so it is only rebuilt when its own toggle changed
+        if bool(self.slider) != self.enable_slider.get():
+            self._clear_slider()
+            if self.enable_slider.get():
+                self._add_slider()
+        self._request_redraw()
 
     def _clear_interactivity(self):
         """Remove slider and cursor from the chart."""
-        # Clear slider
-        if self.slider:
-            # Removing axes is tricky in matplotlib embedded
-            # Best approach is to remove the ax from figure
+        self._clear_slider()
+
+        # Stop waiting for a hover
+        if self._hover_cid is not None:
+            self.canvas.mpl_disconnect(self._hover_cid)
+            self._hover_cid = None
+        if self._hover_job is not None:
+            self.after_cancel(self._hover_job)
+            self._hover_job = None
+        self._hover_event = None
+
+        # Clear mplcursors
+        if self.mpl_cursor:
             try:
-                self.figure.delaxes(self.slider.ax)
+                self.mpl_cursor.remove()
             except Exception:
                 pass
-            self.slider = None
-            
+            self.mpl_cursor = None
+
+    def _clear_slider(self):
+        """Remove the time slider and its cursor line from the chart."""
         if self.cursor_line:
             try:
                 self.cursor_line.remove()
             except Exception:
                 pass
             self.cursor_line = None
+
+        if self.slider:
+            # Hide the slider rather than deleting its axes - adding and removing axes
+            # invalidates the figure's layout, and the next chart can reuse it
+            self.slider.set_active(False)
+            self.slider.ax.set_visible(False)
+            self.slider = None
             
         # Reset subplot adjustment
         self.figure.subplots_adjust(bottom=0.1)
 
-        # Clear mplcursors
-        if self.mpl_cursor:
-            try:
-                self.mpl_cursor.remove()
-            except Exception:
-                pass
-            self.mpl_cursor = None
+    def _set_cursor_enabled(self, enabled: bool):
+        """Turn the hover cursor on or off, hiding any tooltip it is showing when turned off."""
+        if not self.mpl_cursor:
+            return
+        self.mpl_cursor.enabled = enabled
+        if not enabled:
+            for sel in list(self.mpl_cursor.selections):
+                self.mpl_cursor.remove_selection(sel)
 
     def _add_interactivity(self):
         """Add a time slider and hover cursors to the chart."""
@@ -714,113 +1093,145 @@ class SnapshotDecoderApp(tk.Tk):
             return
             
         # --- Add Hover Cursors ---
-        if self.enable_cursor.get():
-            # We target all lines/bars/collections in the axes
-            artists = []
-            if self.ax_left:
-                artists.extend(self.ax_left.lines)
-                artists.extend(self.ax_left.containers) # For bars
-                artists.extend(self.ax_left.collections) # For scatter/bubble
-                
-            if self.ax_right:
-                artists.extend(self.ax_right.lines)
-                artists.extend(self.ax_right.containers)
-                artists.extend(self.ax_right.collections)
-                
-            if artists:
-                self.mpl_cursor = mplcursors.cursor(artists, hover=True)
-                
-                @self.mpl_cursor.connect("add")
-                def on_add(sel):
-                    # Customize tooltip text
-                    # sel.target is the (x, y) point
-                    # sel.artist.get_label() gets the series name
-                    try:
-                        label = sel.artist.get_label()
-                        x, y = sel.target
-                        
-                        # Format x if it's time
-                        x_col = self.working_config.get_x_column()
-                        if x_col in ["Time", "Time (MM:SS)"]:
-                            minutes = int(x // 60)
-                            seconds = int(x % 60)
-                            x_str = f"{minutes:02d}:{seconds:02d}"
-                        else:
-                            x_str = f"{x:.2f}"
-                            
-                        sel.annotation.set_text(f"{label}\ntime: {x_str}\nvalue: {y:.2f}")
-                        
-                        # Style the annotation box
-                        sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9)
-                    except Exception:
-                        pass
+        # Not built until the mouse pauses over the chart with the option on - see _on_chart_hover
+        self._hover_cid = self.canvas.mpl_connect("motion_notify_event", self._on_chart_hover)
 
         # --- Add Time Slider ---
         if self.enable_slider.get():
-            # Determine X data range
-            df = self.working_config.data.copy()
-            x_col = self.working_config.get_x_column()
+            self._add_slider()
+
+    def _on_chart_hover(self, event):
+        """Wait for the mouse to rest over the chart before building the hover cursor."""
+        if self.mpl_cursor or not self.enable_cursor.get():
+            return
+        if self._hover_job is not None:
+            self.after_cancel(self._hover_job)
+            self._hover_job = None
+        if event.inaxes is None or event.inaxes not in (self.ax_left, self.ax_right):
+            return
+        self._hover_event = event
+        self._hover_job = self.after(HOVER_CURSOR_DELAY_MS, self._spawn_cursor)
+
+    def _spawn_cursor(self):
+        """Build the hover cursor and hand it the motion event that triggered it."""
+        self._hover_job = None
+        event, self._hover_event = self._hover_event, None
+        if self.mpl_cursor or not self.enable_cursor.get():
+            return
+        self._add_cursor()
+        if self.mpl_cursor and event is not None:
+            # Replay the resting mouse position so the tooltip shows without another move
+            self.canvas.callbacks.process("motion_notify_event", event)
+
+    def _add_cursor(self):
+        """Attach mplcursors hover tooltips to every plotted series/bar/collection on the chart."""
+        # We target the plotted lines, bars and collections in the axes. Lines labelled with a
+        # leading underscore (slider cursor line, helper lines) aren't data, so they're skipped
+        artists = []
+        for ax in (self.ax_left, self.ax_right):
+            if ax:
+                artists.extend(line for line in ax.lines if not line.get_label().startswith("_"))
+                artists.extend(ax.containers) # For bars
+                artists.extend(ax.collections) # For scatter/bubble
             
-            # Convert timedelta if necessary (matching ChartRenderer logic)
-            if pd.api.types.is_timedelta64_dtype(df.get("Time")):
-                df["Time"] = df["Time"].dt.total_seconds()
-            elif pd.api.types.is_timedelta64_dtype(df.get("Time (MM:SS)")):
-                df["Time (MM:SS)"] = df["Time (MM:SS)"].dt.total_seconds()
-                
-            if x_col and x_col in df.columns:
-                x_data = df[x_col]
-            else:
-                x_data = df.index
-                
-            min_val = float(x_data.min())
-            max_val = float(x_data.max())
+        if artists:
+            # Imported on first use - mplcursors pulls in pyplot, which slows startup
+            import mplcursors
+            # Transient tooltips disappear when the mouse moves off; no highlight copies of the artists
+            self.mpl_cursor = mplcursors.cursor(
+                artists, hover=mplcursors.HoverMode.Transient, highlight=False,
+                annotation_kwargs=HOVER_ANNOTATION_KWARGS,
+            )
             
-            # Adjust layout to make room for slider at the bottom
-            self.figure.subplots_adjust(bottom=0.2)
+            # The x column is fixed for this chart - look it up once, not on every hover
+            is_time_x = self.working_config.get_x_column() in ("Time", "Time (MM:SS)")
             
+            @self.mpl_cursor.connect("add")
+            def on_add(sel, is_time_x=is_time_x):
+                # Customize tooltip text
+                # sel.target is the (x, y) point
+                # sel.artist.get_label() gets the series name
+                try:
+                    label = sel.artist.get_label()
+                    x, y = sel.target
+                    
+                    # Format x if it's time
+                    if is_time_x:
+                        x_str = seconds_to_min_sec(x)
+                    else:
+                        x_str = f"{x:.2f}"
+                        
+                    sel.annotation.set_text(f"{label}\ntime: {x_str}\nvalue: {y:.2f}")
+                except Exception:
+                    pass
+
+    def _add_slider(self):
+        """Add a time slider with a vertical cursor line to the chart."""
+        # Determine X data range (cached on the config, so rebuilding the slider doesn't rescan)
+        x_col = self.working_config.get_x_column()
+        min_val, max_val = self.working_config.get_x_range()
+        
+        # Adjust layout to make room for slider at the bottom
+        self.figure.subplots_adjust(bottom=0.2)
+        
+        # Widgets are imported on first use to keep them out of app startup
+        from ui.slider_cursor import SliderCursorLine
+
+        label = x_col if x_col else "Index"
+        slider = self._slider_widget
+        if slider is None or slider.ax not in self.figure.axes:
+            # First slider, or a full render cleared the figure and took the old one with it
+            from matplotlib.widgets import Slider
+
             # Create slider axis [left, bottom, width, height] in figure coordinates
             ax_slider = self.figure.add_axes([0.15, 0.05, 0.7, 0.03])
-            
-            self.slider = Slider(
+            slider = Slider(
                 ax=ax_slider,
-                label=x_col if x_col else "Index",
+                label=label,
                 valmin=min_val,
                 valmax=max_val,
                 valinit=min_val,
             )
-            
-            # Add vertical cursor line
-            self.cursor_line = self.ax_left.axvline(x=min_val, color='red', alpha=0.5, linestyle='--')
-            
-            def update(val):
-                # The memory specifically mentions using set_xdata([x, x]) for axvline updates
-                self.cursor_line.set_xdata([val, val])
-                self.canvas.draw_idle()
-                
-            self.slider.on_changed(update)
+            self._slider_widget = slider
+        else:
+            # Re-range the hidden slider instead of adding a new axes to the figure
+            slider.valmin, slider.valmax, slider.valinit = min_val, max_val, min_val
+            slider.ax.set_xlim(min_val, max_val)
+            slider.vline.set_xdata([min_val, min_val])
+            slider.poly.set_x(min_val)
+            slider.label.set_text(label)
+            slider.set_val(min_val)
+            slider.ax.set_visible(True)
+            slider.set_active(True)
+        self.slider = slider
+        
+        # Add vertical cursor line - it follows the slider by blitting, without redrawing the series
+        self.cursor_line = SliderCursorLine(self.canvas, self.ax_left, self.slider, min_val)
 
     def open_chart_table(self):
         if not self.engine or self.engine.snapshot.empty:
             messagebox.showinfo("No data", "Open a file first so I can show the chart table.")
             return
         # Check if Chart Table is already open
-        if hasattr(self, 'chart_table_window') and self.chart_table_window and self.chart_table_window.winfo_exists():
+        if self.chart_table_window is not None and self.chart_table_window.winfo_exists():
             self.chart_table_window.lift()
             return
         # Union of primary and secondary (no duplicates, preserve order)
-        selected = list(dict.fromkeys(list(self.primary_series) + list(self.secondary_series)))
+        selected = dict.fromkeys(itertools.chain(self.primary_series, self.secondary_series))
         if not selected:
             messagebox.showinfo("No selection", "Add PIDs to Primary or Secondary axis first.")
             return
-        existing = [c for c in selected if c in self.engine.snapshot.columns]
+        col_set = frozenset(self.engine.snapshot.columns)
+        existing = [c for c in selected if c in col_set]
         if not existing:
             messagebox.showinfo("No selection", "Selected PIDs not found in data.")
             return
-        if "Time" in self.engine.snapshot.columns:
+        if "Time" in col_set:
             columns = ["Time"] + [c for c in existing if c != "Time"]
         else:
             columns = existing
-        df = self.engine.snapshot[columns].copy()
+        # Selecting a list of columns already builds a new frame, and the table only reads it
+        df = self.engine.snapshot[columns]
         win = DataTableWindow(self, df, self.engine.file_path, "Chart Table")
         self.chart_table_window = win.win
 
@@ -828,6 +1239,8 @@ class SnapshotDecoderApp(tk.Tk):
         # Clear selected series and listboxes
         self.primary_series = []
         self.secondary_series = []
+        self._primary_set = set()
+        self._secondary_set = set()
         
         # Clear custom ticks
         self.primary_ticks = None
@@ -842,44 +1255,70 @@ class SnapshotDecoderApp(tk.Tk):
         except Exception:
             pass
 
-        # Reset axis auto toggles and range entries
-        self.primary_auto.set(True)
-        self.secondary_auto.set(True)
+        # Traces are held while the variables are reset - nothing is plotted after a clear
+        self._suspend_traces = True
         try:
-            self._toggle_primary_inputs()
-            self._toggle_secondary_inputs()
-        except Exception:
-            pass
+            # Reset axis auto toggles and range entries
+            self.primary_auto.set(True)
+            self.secondary_auto.set(True)
+            try:
+                self._toggle_primary_inputs()
+                self._toggle_secondary_inputs()
+            except Exception:
+                pass
 
-        # Clear any manual limits
-        try:
-            self.primary_ymin.set("")
-            self.primary_ymax.set("")
-            self.secondary_ymin.set("")
-            self.secondary_ymax.set("")
-        except Exception:
-            pass
-        try:
-            self.primary_min.set("")
-            self.primary_max.set("")
-            self.secondary_min.set("")
-            self.secondary_max.set("")
-        except Exception:
-            pass
+            # Clear any manual limits
+            try:
+                self.primary_ymin.set("")
+                self.primary_ymax.set("")
+                self.secondary_ymin.set("")
+                self.secondary_ymax.set("")
+            except Exception:
+                pass
+            try:
+                self.primary_min.set("")
+                self.primary_max.set("")
+                self.secondary_min.set("")
+                self.secondary_max.set("")
+            except Exception:
+                pass
+        finally:
+            self._suspend_traces = False
 
         # Clear working config
         self.working_config = None
+        self._plotted_series = None
+        self._discard_pending_plot()
+        if self._plot_job is not None:
+            # ...and any replot still waiting for series edits to pause
+            self.after_cancel(self._plot_job)
+            self._plot_job = None
+
+        # Drop the slider and hover cursor along with the chart they belong to
+        self._clear_interactivity()
 
-        # Clear and rebuild the axes
-        self.figure.clear()
-        self.ax_left = self.figure.add_subplot(111)
-        self.ax_right = self.ax_left.twinx()
+        # Clear the axes in place when the figure still holds the plain left/right pair;
+        # only rebuild them when a chart left a different layout behind (no twin, colorbar, ...)
+        visible_axes = {ax for ax in self.figure.axes if ax.get_visible()}
+        if (
+            self.ax_left is not None
+            and self.ax_right is not None
+            and visible_axes == {self.ax_left, self.ax_right}
+        ):
+            self.ax_left.cla()
+            self.ax_right.cla()
+            # cla() puts the twin's label back on the left
+            self.ax_right.yaxis.set_label_position("right")
+        else:
+            self.figure.clear()
+            self.ax_left = self.figure.add_subplot(111)
+            self.ax_right = self.ax_left.twinx()
+            self.figure.tight_layout()
         self.ax_left.set_title("Chart Area")
         self.ax_left.set_xlabel("Index / Time")
         self.ax_left.set_ylabel("Primary")
         self.ax_right.set_ylabel("Secondary")
-        self.figure.tight_layout()
-        self.canvas.draw_idle()
+        self._request_redraw()
 
     def add_current_to_cart(self):
         """Add a deep copy of the working config to the cart."""
@@ -889,24 +1328,21 @@ class SnapshotDecoderApp(tk.Tk):
         
         if self.working_config:
             # Capture current axis limits from the chart (after pan/zoom)
-            if hasattr(self, 'ax_left') and self.ax_left:
-                ymin_primary, ymax_primary = self.ax_left.get_ylim()
-                self.working_config.primary_axis.min_value = ymin_primary
-                self.working_config.primary_axis.max_value = ymax_primary
-                self.working_config.primary_axis.auto_scale = False
+            self._capture_limits(self.working_config)
             
-            if hasattr(self, 'ax_right') and self.ax_right:
-                ymin_secondary, ymax_secondary = self.ax_right.get_ylim()
-                self.working_config.secondary_axis.min_value = ymin_secondary
-                self.working_config.secondary_axis.max_value = ymax_secondary
-                self.working_config.secondary_axis.auto_scale = False
-            
-            # Deep copy the config including the DataFrame to avoid reference issues
-            config_copy = copy.deepcopy(self.working_config)
+            # Independent copy of the config; the (never modified) data frame is shared, not copied
+            config_copy = self.working_config.clone_sharing_data()
             self.chart_cart.add_config(config_copy)
         else:
             messagebox.showinfo("No chart", "Configure a chart first to add it to the cart.")
 
+    def _capture_limits(self, cfg: ChartConfig):
+        """Fix cfg's y-axis limits to what the drawn axes currently show (after any pan/zoom)."""
+        for ax, axis_cfg in ((self.ax_left, cfg.primary_axis), (self.ax_right, cfg.secondary_axis)):
+            if ax is not None:
+                axis_cfg.min_value, axis_cfg.max_value = ax.get_ylim()
+                axis_cfg.auto_scale = False
+
     def pop_out_chart(self):
         """Open the current chart in a separate window."""
         # Only sync if not a custom chart (bubble or bar with custom data)
@@ -918,17 +1354,7 @@ class SnapshotDecoderApp(tk.Tk):
             return
         
         # Capture current axis limits from the chart (after pan/zoom)
-        if hasattr(self, 'ax_left') and self.ax_left:
-            ymin_primary, ymax_primary = self.ax_left.get_ylim()
-            self.working_config.primary_axis.min_value = ymin_primary
-            self.working_config.primary_axis.max_value = ymax_primary
-            self.working_config.primary_axis.auto_scale = False
-        
-        if hasattr(self, 'ax_right') and self.ax_right:
-            ymin_secondary, ymax_secondary = self.ax_right.get_ylim()
-            self.working_config.secondary_axis.min_value = ymin_secondary
-            self.working_config.secondary_axis.max_value = ymax_secondary
-            self.working_config.secondary_axis.auto_scale = False
+        self._capture_limits(self.working_config)
         
         # Open pop-out window with current config and cart
         ChartPopupWindow(self, self.working_config, chart_cart=self.chart_cart)
@@ -954,7 +1380,7 @@ class SnapshotDecoderApp(tk.Tk):
             tk.messagebox.showinfo("PID Descriptions", "No PID information available.")
             return
 
-        PidInfoWindow(self, self.engine.pid_info, self.engine.file_path, self)
+        PidInfoWindow(self, self.engine.pid_rows, self.engine.file_path, self)
 
 #------------------------------------------------------------------------------------------------------------------------------
 #----------------------------------------------------- Export PDF--------------------------------------------------------------
@@ -976,27 +1402,49 @@ class SnapshotDecoderApp(tk.Tk):
         if not filepath:
             return  # User cancelled
         
+        if self._pdf_export_thread is not None and self._pdf_export_thread.is_alive():
+            messagebox.showinfo("Export In Progress", "A PDF export is already running. Please wait for it to finish.")
+            return
+        
+        # Prepare metadata
+        metadata = {
+            'Title': 'Snapshot Chart Report',
+            'Author': 'Snapshot Decoder',
+            'Subject': f'Charts from {self.engine.file_path if self.engine else "snapshot"}',
+            'Creator': f'{APP_TITLE} v{APP_VERSION}'
+        }
+        chart_count = len(self.chart_cart.configs)
+        
+        def _run():
+            # Pages are drawn on plain Figures with the PDF canvas - no pyplot or Tk calls here
+            try:
+                self.chart_cart.export_to_pdf(
+                    filepath,
+                    page_size=(11, 8.5),  # Landscape letter
+                    dpi=150,
+                    metadata=metadata
+                )
+                self._pdf_export_results.put((filepath, chart_count, None))
+            except Exception as e:
+                self._pdf_export_results.put((filepath, chart_count, e))
+        
+        # Export on a worker thread so the window stays responsive for big carts
+        self._pdf_export_thread = threading.Thread(target=_run, daemon=True)
+        self._pdf_export_thread.start()
+        self.after(PLOT_POLL_MS, self._check_pdf_export)
+    
+    def _check_pdf_export(self):
+        """Report the cart PDF export result once the worker thread has finished."""
         try:
-            # Prepare metadata
-            metadata = {
-                'Title': 'Snapshot Chart Report',
-                'Author': 'Snapshot Decoder',
-                'Subject': f'Charts from {self.engine.file_path if self.engine else "snapshot"}',
-                'Creator': f'{APP_TITLE} v{APP_VERSION}'
-            }
-            
-            # Export to PDF
-            self.chart_cart.export_to_pdf(
-                filepath,
-                page_size=(11, 8.5),  # Landscape letter
-                dpi=150,
-                metadata=metadata
-            )
-            
-            messagebox.showinfo("Export Complete", f"Successfully exported {len(self.chart_cart.configs)} charts to:\n{filepath}")
+            filepath, chart_count, error = self._pdf_export_results.get_nowait()
+        except queue.Empty:
+            self.after(PLOT_POLL_MS, self._check_pdf_export)
+            return
         
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export PDF:\n{str(e)}")
+        if error is None:
+            messagebox.showinfo("Export Complete", f"Successfully exported {chart_count} charts to:\n{filepath}")
+        else:
+            messagebox.showerror("Export Failed", f"Failed to export PDF:\n{str(error)}")
 
 #------------------------------------------------------------------------------------------------------------------------------
 #---------------------------------------------------- Help & About -------------------------------------------------------------
@@ -1036,15 +1484,16 @@ class SnapshotDecoderApp(tk.Tk):
         try:
             img_path = resource_path("data/images/splash.png")
             if os.path.exists(img_path):
-                # Keep a reference to prevent garbage collection
-                about_img = tk.PhotoImage(file=img_path)
+                pil_img = Image.open(img_path)
                 
                 # Auto-scale down if too wide for the window
-                # Assuming a margin of ~50px
+                # Assuming a margin of ~50px. thumbnail() keeps the aspect ratio and only
+                # ever shrinks, so any scale factor works (not just whole-number steps)
                 target_width = window_width - 50
-                if about_img.width() > target_width:
-                    scale_factor = (about_img.width() // target_width) + 1
-                    about_img = about_img.subsample(scale_factor)
+                pil_img.thumbnail((target_width, 10_000), Image.LANCZOS)
+                
+                # Keep a reference to prevent garbage collection
+                about_img = ImageTk.PhotoImage(pil_img)
                 
                 img_label = tk.Label(about_win, image=about_img, bg=bg_color)
                 img_label.image = about_img  # Keep reference
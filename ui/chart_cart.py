@@ -25,6 +25,12 @@ class ChartCart:
             if hasattr(self, 'container'):
                 self._rebuild_ui()
 
+    def clear(self):
+        """Remove every config."""
+        self.configs.clear()
+        if hasattr(self, 'container'):
+            self._rebuild_ui()
+
     def reorder_configs(self, from_idx, to_idx):
         """Move config from from_idx to to_idx."""
         if 0 <= from_idx < len(self.configs) and 0 <= to_idx < len(self.configs):
@@ -122,14 +128,15 @@ class ChartCart:
         
         Args:
             filepath: Path to save the PDF file
-            **kwargs: Additional arguments (page_size, dpi, metadata)
+            **kwargs: Additional arguments (page_size, dpi, metadata, on_page_finished)
         """
         from file_io.pdf_export import ChartCartPdfExporter
         
         if not self.configs:
             raise ValueError("Chart cart is empty. Add charts before exporting.")
         
-        exporter = ChartCartPdfExporter(self.configs)
+        # Export from a snapshot of the list, so cart edits made during a background export don't affect it
+        exporter = ChartCartPdfExporter(list(self.configs))
         
         if 'metadata' in kwargs:
             exporter.export_with_metadata(filepath, **kwargs)
@@ -6,17 +6,15 @@ A standalone window that displays a chart with its own toolbar.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import copy
-import pandas as pd
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.widgets import Slider
-import mplcursors
 
 from domain.chart_config import ChartConfig
+from domain.constants import HOVER_ANNOTATION_KWARGS
 from ui.chart_renderer import ChartRenderer
 from ui.custom_toolbar import CustomNavigationToolbar
+from utils import seconds_to_min_sec
 
 
 class ChartPopupWindow(tk.Toplevel):
@@ -25,8 +23,8 @@ class ChartPopupWindow(tk.Toplevel):
     def __init__(self, parent, config: ChartConfig, chart_cart=None):
         super().__init__(parent)
         
-        # Deep copy config to make this window independent
-        self.config = copy.deepcopy(config)
+        # Copy config to make this window independent (the data frame itself is shared, never modified)
+        self.config = config.clone_sharing_data()
         self.chart_cart = chart_cart
         
         # Window setup
@@ -88,13 +86,13 @@ class ChartPopupWindow(tk.Toplevel):
             self.ax_left.clear()
             self.ax_left.text(0.5, 0.5, f"Error: {str(e)}", 
                             ha='center', va='center', transform=self.ax_left.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
     
     def _on_interactivity_change(self, *args):
         """Callback when interactivity options change."""
         self._clear_interactivity()
         self._add_interactivity()
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def _clear_interactivity(self):
         """Remove existing slider and cursors."""
@@ -127,59 +125,51 @@ class ChartPopupWindow(tk.Toplevel):
         
         # --- Add Hover Cursors ---
         if self.enable_cursor.get():
+            # Skip underscore-labelled lines (slider cursor line, helper lines) - they aren't data
             artists = []
-            if self.ax_left:
-                artists.extend(self.ax_left.lines)
-                artists.extend(self.ax_left.containers)
-                artists.extend(self.ax_left.collections)
-            if self.ax_right:
-                artists.extend(self.ax_right.lines)
-                artists.extend(self.ax_right.containers)
-                artists.extend(self.ax_right.collections)
+            for ax in (self.ax_left, self.ax_right):
+                if ax:
+                    artists.extend(line for line in ax.lines if not line.get_label().startswith("_"))
+                    artists.extend(ax.containers)
+                    artists.extend(ax.collections)
             
             if artists:
-                self.mpl_cursor = mplcursors.cursor(artists, hover=True)
+                # Imported on first use - mplcursors pulls in pyplot, which slows startup
+                import mplcursors
+                # Transient tooltips disappear when the mouse moves off; no highlight copies of the artists
+                self.mpl_cursor = mplcursors.cursor(
+                    artists, hover=mplcursors.HoverMode.Transient, highlight=False,
+                    annotation_kwargs=HOVER_ANNOTATION_KWARGS,
+                )
+                
+                # The x column is fixed for this chart - look it up once, not on every hover
+                is_time_x = self.config.get_x_column() in ("Time", "Time (MM:SS)")
                 
                 @self.mpl_cursor.connect("add")
-                def on_add(sel):
+                def on_add(sel, is_time_x=is_time_x):
                     try:
                         label = sel.artist.get_label()
                         x, y = sel.target
                         
-                        x_col = self.config.get_x_column()
-                        if x_col in ["Time", "Time (MM:SS)"]:
-                            minutes = int(x // 60)
-                            seconds = int(x % 60)
-                            x_str = f"{minutes:02d}:{seconds:02d}"
+                        if is_time_x:
+                            x_str = seconds_to_min_sec(x)
                         else:
                             x_str = f"{x:.2f}"
                         
                         sel.annotation.set_text(f"{label}\ntime: {x_str}\nvalue: {y:.2f}")
-                        sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9)
                     except Exception:
                         pass
         
         # --- Add Time Slider ---
         if self.enable_slider.get():
-            df = self.config.data.copy()
             x_col = self.config.get_x_column()
-            
-            if pd.api.types.is_timedelta64_dtype(df.get("Time")):
-                df["Time"] = df["Time"].dt.total_seconds()
-            elif pd.api.types.is_timedelta64_dtype(df.get("Time (MM:SS)")):
-                df["Time (MM:SS)"] = df["Time (MM:SS)"].dt.total_seconds()
-            
-            if x_col and x_col in df.columns:
-                x_data = df[x_col]
-            else:
-                x_data = df.index
-            
-            min_val = float(x_data.min())
-            max_val = float(x_data.max())
+            min_val, max_val = self.config.get_x_range()
             
             self.figure.subplots_adjust(bottom=0.2)
             ax_slider = self.figure.add_axes([0.15, 0.05, 0.7, 0.03])
             
+            from matplotlib.widgets import Slider
+            from ui.slider_cursor import SliderCursorLine
             self.slider = Slider(
                 ax=ax_slider,
                 label=x_col if x_col else "Index",
@@ -188,13 +178,8 @@ class ChartPopupWindow(tk.Toplevel):
                 valinit=min_val,
             )
             
-            self.cursor_line = self.ax_left.axvline(x=min_val, color='red', alpha=0.5, linestyle='--')
-            
-            def update(val):
-                self.cursor_line.set_xdata([val, val])
-                self.canvas.draw_idle()
-            
-            self.slider.on_changed(update)
+            # Cursor line follows the slider by blitting, without redrawing the series
+            self.cursor_line = SliderCursorLine(self.canvas, self.ax_left, self.slider, min_val)
     
     def _add_to_cart(self):
         """Add a copy of this chart's config to the cart."""
@@ -215,5 +200,5 @@ class ChartPopupWindow(tk.Toplevel):
             self.config.secondary_axis.max_value = ymax_secondary
             self.config.secondary_axis.auto_scale = False
         
-        config_copy = copy.deepcopy(self.config)
+        config_copy = self.config.clone_sharing_data()
         self.chart_cart.add_config(config_copy)
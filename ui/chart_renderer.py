@@ -6,16 +6,21 @@ with primary and secondary axes. Can be used in various contexts: main window,
 separate windows, or PDF export.
 """
 
+import warnings
 from typing import Optional, Tuple
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-from matplotlib.ticker import FuncFormatter
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.ticker import AutoLocator, FuncFormatter, ScalarFormatter
 from matplotlib import dates as mdates
 
 from domain.chart_config import ChartConfig, ChartType
+from services.downsample import run_edge_indices
+from utils import seconds_to_min_sec
 
 
 class ChartRenderer:
@@ -69,7 +74,7 @@ class ChartRenderer:
             The PID description if available, otherwise the PID name
         """
         if self.config.pid_info and pid_name in self.config.pid_info:
-            description = self.config.pid_info[pid_name].get("Description", "")
+            description = self.config.pid_info[pid_name].description
             if description:
                 return description
         return pid_name
@@ -94,13 +99,6 @@ class ChartRenderer:
         if clear_figure:
             figure.clear()
         
-        # Prepare data: convert Timedelta to seconds for plotting
-        plot_data = self.config.data.copy()
-        if pd.api.types.is_timedelta64_dtype(plot_data.get("Time")):
-            plot_data["Time"] = plot_data["Time"].dt.total_seconds()
-        elif pd.api.types.is_timedelta64_dtype(plot_data.get("Time (MM:SS)")):
-            plot_data["Time (MM:SS)"] = plot_data["Time (MM:SS)"].dt.total_seconds()
-        
         # Store figure reference for colorbar support in bubble charts
         self._figure = figure
         
@@ -108,6 +106,76 @@ class ChartRenderer:
         ax_left = figure.add_subplot(111)
         ax_right = ax_left.twinx() if self.config.secondary_axis.series else None
         
+        self._draw(ax_left, ax_right)
+        
+        # Finalize
+        figure.tight_layout()
+        if canvas:
+            canvas.draw_idle()
+        
+        return ax_left, ax_right
+    
+    def update(
+        self,
+        figure: Figure,
+        ax_left: Axes,
+        ax_right: Optional[Axes],
+        canvas: Optional[object] = None
+    ) -> Tuple[Axes, Optional[Axes]]:
+        """
+        Re-draw the chart into the axes already on the figure instead of rebuilding them.
+        
+        Only line and status charts are drawn this way, and only when the figure shows
+        exactly the given axes pair with a secondary axis matching the config (hidden
+        axes, such as a parked slider, are ignored). Anything else falls back to a full
+        render().
+        
+        Args:
+            figure: Matplotlib Figure the axes belong to
+            ax_left: Existing primary axis
+            ax_right: Existing secondary (twinx) axis, or None
+            canvas: Optional canvas object (e.g., FigureCanvasTkAgg) to refresh
+        
+        Returns:
+            Tuple of (primary_axis, secondary_axis)
+        """
+        wants_right = bool(self.config.secondary_axis.series)
+        current_axes = {ax for ax in (ax_left, ax_right) if ax is not None}
+        if (
+            self.config.chart_type not in ("line", "status")
+            or ax_left is None
+            or wants_right != (ax_right is not None)
+            or {ax for ax in figure.axes if ax.get_visible()} != current_axes
+        ):
+            return self.render(figure, canvas)
+        
+        self._figure = figure
+        plot_data = self._prepare_plot_data()
+        if self.config.chart_type == "line" and self._refresh_lines(ax_left, ax_right, plot_data):
+            # Same series on the same axes - the existing lines now hold the new data
+            self._apply_formatting(ax_left, ax_right)
+        else:
+            ax_left.cla()
+            if ax_right:
+                ax_right.cla()
+                # cla() puts the twin's label back on the left
+                ax_right.yaxis.set_label_position("right")
+            self._draw(ax_left, ax_right, plot_data)
+        
+        # tight_layout skips axes that aren't subplots (a parked slider) but warns about them
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="This figure includes Axes that are not compatible")
+            figure.tight_layout()
+        if canvas:
+            canvas.draw_idle()
+        
+        return ax_left, ax_right
+    
+    def _draw(self, ax_left: Axes, ax_right: Optional[Axes], plot_data: Optional[pd.DataFrame] = None):
+        """Plot the configured chart type onto the axes and apply common formatting."""
+        if plot_data is None:
+            plot_data = self._prepare_plot_data()
+        
         # Render based on chart type
         if self.config.chart_type == "line":
             self._render_line_chart(ax_left, ax_right, plot_data)
@@ -122,13 +190,179 @@ class ChartRenderer:
         
         # Apply common formatting
         self._apply_formatting(ax_left, ax_right)
-        
-        # Finalize
-        figure.tight_layout()
-        if canvas:
-            canvas.draw_idle()
-        
-        return ax_left, ax_right
+    
+    def _prepare_plot_data(self) -> pd.DataFrame:
+        """config.data with timedelta time columns converted to seconds for plotting."""
+        # Prepare data: convert Timedelta to seconds for plotting. The renderers only read
+        # plot_data, so the frame is used as-is; a converted time column goes into a shallow
+        # copy, which shares every other column with config.data instead of duplicating it
+        plot_data = self.config.data
+        if pd.api.types.is_timedelta64_dtype(plot_data.get("Time")):
+            plot_data = plot_data.copy(deep=False)
+            if self.config.get_x_column() == "Time":
+                # Same seconds the slider range is built from - converted once per data frame
+                plot_data["Time"] = self.config.x_numeric()
+            else:
+                plot_data["Time"] = plot_data["Time"].dt.total_seconds()
+        elif pd.api.types.is_timedelta64_dtype(plot_data.get("Time (MM:SS)")):
+            plot_data = plot_data.copy(deep=False)
+            plot_data["Time (MM:SS)"] = plot_data["Time (MM:SS)"].dt.total_seconds()
+        return plot_data
+    
+    def _refresh_lines(self, ax_left: Axes, ax_right: Optional[Axes], plot_data: pd.DataFrame) -> bool:
+        """
+        Give the line chart's existing Line2D artists the new data instead of re-creating them.
+        
+        Data lines carry their series name as gid, so each axis is diffed per series: lines
+        of series that were dropped are removed, kept series get their new data, and newly
+        added series are plotted once. This works as long as the kept series stay in the
+        same order ahead of the new ones (adding at the end, removing anywhere). A reorder,
+        a line that isn't a series, an axis without any series lines, or anything else left
+        on an axis (bars, texts, collections - e.g. from a quick chart drawn into the same
+        axes) returns False without touching the axes, so the caller can clear and redraw.
+        """
+        axes = [(ax_left, self.config.primary_axis.series, False)]
+        if ax_right:
+            axes.append((ax_right, self.config.secondary_axis.series, True))
+        plan = []
+        for ax, series, is_secondary in axes:
+            wanted = [s for s in series if s in plot_data.columns]
+            current = [line.get_gid() for line in ax.lines]
+            if not current or None in current or len(set(current)) != len(current):
+                return False
+            if ax.patches or ax.texts or ax.collections or ax.containers:
+                return False
+            kept = [gid for gid in current if gid in wanted]
+            if wanted[:len(kept)] != kept:
+                return False
+            plan.append((ax, is_secondary, set(kept), wanted[len(kept):]))
+        
+        for ax, is_secondary, kept, added in plan:
+            for line in list(ax.lines):
+                if line.get_gid() not in kept:
+                    line.remove()
+            for line in ax.lines:
+                series_name = line.get_gid()
+                x, y = self._line_xy(series_name, plot_data)
+                style = self.config.get_series_style(series_name, is_secondary=is_secondary)
+                line.set_data(x, y)
+                line.set(
+                    label=self._get_legend_label(series_name),
+                    linestyle=style.linestyle,
+                    linewidth=style.linewidth,
+                    marker=style.marker,
+                    markersize=style.markersize,
+                    alpha=style.alpha
+                )
+            for series_name in added:
+                self._plot_line(ax, series_name, plot_data, is_secondary)
+            # The axis' colour cycle doesn't rewind when lines are removed. Recolour in series
+            # order so every line gets the colour a fresh render (pop-out, cart, PDF) would give it
+            cycle = 0
+            for line in ax.lines:
+                color = self.config.get_series_style(line.get_gid(), is_secondary=is_secondary).color
+                if not color:
+                    color = f"C{cycle}"
+                    cycle += 1
+                line.set_color(color)
+            
+            # Undo what _apply_formatting may have left from the last chart, as cla() would.
+            # The legend is left alone - _apply_formatting keeps it if its entries are unchanged
+            ax.yaxis.set_major_locator(AutoLocator())
+            ax.yaxis.set_major_formatter(ScalarFormatter())
+            ax.relim()
+            ax.set_autoscale_on(True)
+            ax.autoscale_view()
+        ax_left.grid(False)
+        return True
+    
+    def _update_legend(self, ax: Axes, show: bool, loc):
+        """
+        Show or remove the axis legend, reusing the existing one when nothing in it changed.
+
+        Laying out a legend measures every label, so a replot that keeps the same lines
+        (same labels and styles, same location) keeps the legend already on the axis.
+        """
+        legend = ax.get_legend()
+        if not show:
+            if legend:
+                legend.remove()
+            return
+        key = self._legend_key(ax, loc)
+        if legend is not None and key is not None and getattr(legend, "_chart_key", None) == key:
+            return
+        legend = ax.legend(loc=loc)
+        legend._chart_key = key
+    
+    @staticmethod
+    def _legend_key(ax: Axes, loc):
+        """What a legend of ax's lines shows, or None if it holds anything other than lines."""
+        handles, labels = ax.get_legend_handles_labels()
+        if not all(isinstance(h, Line2D) for h in handles):
+            return None
+        styles = tuple(
+            (to_rgba(h.get_color()), h.get_linestyle(), h.get_linewidth(), h.get_marker(),
+             h.get_markersize(), h.get_alpha())
+            for h in handles
+        )
+        return (loc, tuple(labels), styles)
+    
+    def _line_xy(self, series_name: str, df: pd.DataFrame):
+        """
+        (x, y) arrays to plot for a line series - the downsampled arrays when there are some.
+
+        Plain ndarrays rather than Series, so matplotlib doesn't re-wrap and re-check pandas
+        objects on every plot (the arrays share memory with the numeric columns).
+        """
+        reduced = self.config.data_reduced or {}
+        if series_name in reduced:
+            return reduced[series_name]
+        y = pd.to_numeric(df[series_name], errors="coerce")
+        x_key = self.config.get_x_column()
+        x = df[x_key].to_numpy() if x_key else y.index.to_numpy()
+        return x, y.to_numpy()
+    
+    def _render_line_thumbnail(self, ax_left: Axes, ax_right: Optional[Axes]):
+        """
+        Draw a line chart thumbnail with one LineCollection per axis instead of a Line2D per series.
+
+        Thumbnails have no legend, hover cursor or markers worth seeing at their size, so
+        the series can share a single artist that draws in one call. Charts that use
+        markers, or whose x values aren't plain numbers, are drawn line by line as usual.
+        """
+        plot_data = self._prepare_plot_data()
+        axes = [(ax_left, self.config.primary_axis.series, False)]
+        if ax_right:
+            axes.append((ax_right, self.config.secondary_axis.series, True))
+        
+        collections = []
+        for ax, series, is_secondary in axes:
+            segments, colors, widths, styles = [], [], [], []
+            cycle = 0
+            for series_name in series:
+                if series_name not in plot_data.columns:
+                    continue
+                x, y = self._line_xy(series_name, plot_data)
+                style = self.config.get_series_style(series_name, is_secondary=is_secondary)
+                if style.marker or np.asarray(x).dtype.kind not in "iuf":
+                    self._render_line_chart(ax_left, ax_right, plot_data)
+                    return
+                segments.append(np.column_stack([x, y]))
+                # Same colours the Line2D path would pick: series without their own colour
+                # take the axis' colour cycle in order, the others don't advance it
+                color = style.color
+                if not color:
+                    color = f"C{cycle}"
+                    cycle += 1
+                colors.append(to_rgba(color, style.alpha))
+                widths.append(style.linewidth)
+                styles.append(style.linestyle)
+            if segments:
+                collections.append((ax, LineCollection(segments, colors=colors, linewidths=widths, linestyles=styles)))
+        
+        for ax, collection in collections:
+            ax.add_collection(collection)
+            ax.autoscale_view()
     
     def create_and_render(
         self, 
@@ -164,7 +398,7 @@ class ChartRenderer:
         
         # Render the chart
         if self.config.chart_type == "line":
-            self._render_line_chart(ax_left, ax_right, self.config.data)
+            self._render_line_thumbnail(ax_left, ax_right)
         elif self.config.chart_type == "bar":
             self._render_bar_chart(ax_left, ax_right, self.config.data)
         elif self.config.chart_type == "bubble":
@@ -172,8 +406,8 @@ class ChartRenderer:
         elif self.config.chart_type == "status":
             self._render_status_chart(ax_left, ax_right, self.config.data)
         
-        # Apply formatting (limits, grid, etc.)
-        self._apply_formatting(ax_left, ax_right)
+        # Apply formatting (limits, grid, etc.) - thumbnails never show a legend, so none is laid out
+        self._apply_formatting(ax_left, ax_right, legends=False)
         
         # Apply formatting without labels/titles/legends for thumbnail
         ax_left.set_title("")
@@ -232,131 +466,80 @@ class ChartRenderer:
                     # Stack index
                     y_center = i * 1.5 + 0.5
                     
-                    if x_key:
-                        x = df[x_key]
-                        
-                        # Draw "OFF" blocks (value <= 0.5) - smaller and lighter
-                        # Height: 0.2 (vs 0.8 for ON)
-                        # Color: Light gray or derived from main color but very light
-                        ax.fill_between(
-                            x, 
-                            y_center - 0.1, 
-                            y_center + 0.1, 
-                            where=(y_vals <= 0.5),
-                            step='post',
-                            color='lightgray',
-                            alpha=0.5,
-                            linewidth=0
-                        )
-                        
-                        # Draw "ON" blocks
-                        # We use fill_between to create blocks where y_vals > 0.5 (assuming 0/1 input)
-                        # Top of block: y_center + 0.4
-                        # Bottom of block: y_center - 0.4
-                        
-                        ax.fill_between(
-                            x, 
-                            y_center - 0.4, 
-                            y_center + 0.4, 
-                            where=(y_vals > 0.5),
-                            step='post',
-                            color=style.color,
-                            alpha=style.alpha,
-                            linewidth=0 # No border for blocks usually looks cleaner
-                        )
-                    else:
-                        x = y_vals.index
-                        
-                        # Draw "OFF" blocks
-                        ax.fill_between(
-                            x, 
-                            y_center - 0.1, 
-                            y_center + 0.1, 
-                            where=(y_vals <= 0.5),
-                            step='post',
-                            color='lightgray',
-                            alpha=0.5,
-                            linewidth=0
-                        )
-                        
-                        # Draw "ON" blocks
-                        ax.fill_between(
-                            x, 
-                            y_center - 0.4, 
-                            y_center + 0.4, 
-                            where=(y_vals > 0.5),
-                            step='post',
-                            color=style.color,
-                            alpha=style.alpha,
-                            linewidth=0
-                        )
+                    x = df[x_key] if x_key else y_vals.index
+                    
+                    # Only the first and last point of each ON/OFF run shape the blocks - keep
+                    # just those, so long snapshots don't build polygons with a vertex per frame
+                    on = y_vals.to_numpy() > 0.5
+                    keep = run_edge_indices(on)
+                    x = np.asarray(x)[keep]
+                    on = on[keep]
+                    
+                    # Draw "OFF" blocks (value <= 0.5) - smaller and lighter
+                    # Height: 0.2 (vs 0.8 for ON)
+                    # Color: Light gray or derived from main color but very light
+                    ax.fill_between(
+                        x, 
+                        y_center - 0.1, 
+                        y_center + 0.1, 
+                        where=~on,
+                        step='post',
+                        color='lightgray',
+                        alpha=0.5,
+                        linewidth=0
+                    )
+                    
+                    # Draw "ON" blocks
+                    # We use fill_between to create blocks where y_vals > 0.5 (assuming 0/1 input)
+                    # Top of block: y_center + 0.4
+                    # Bottom of block: y_center - 0.4
+                    
+                    ax.fill_between(
+                        x, 
+                        y_center - 0.4, 
+                        y_center + 0.4, 
+                        where=on,
+                        step='post',
+                        color=style.color,
+                        alpha=style.alpha,
+                        linewidth=0 # No border for blocks usually looks cleaner
+                    )
 
     def _render_line_chart(self, ax_left: Axes, ax_right: Optional[Axes], plot_data: pd.DataFrame):
         """Render a line chart."""
         df = plot_data
-        x_key = self.config.get_x_column()
+        # Lines are tagged with their series name (gid) so a later update can find them again
         
         # Plot primary series
         if self.config.primary_axis.series:
             for series_name in self.config.primary_axis.series:
                 if series_name in df.columns:
-                    y = pd.to_numeric(df[series_name], errors="coerce")
-                    style = self.config.get_series_style(series_name, is_secondary=False)
-                    
-                    legend_label = self._get_legend_label(series_name)
-                    if x_key:
-                        ax_left.plot(
-                            df[x_key], y, 
-                            label=legend_label,
-                            linestyle=style.linestyle,
-                            linewidth=style.linewidth,
-                            marker=style.marker,
-                            markersize=style.markersize,
-                            color=style.color,
-                            alpha=style.alpha
-                        )
-                    else:
-                        ax_left.plot(
-                            y.index, y, 
-                            label=legend_label,
-                            linestyle=style.linestyle,
-                            linewidth=style.linewidth,
-                            marker=style.marker,
-                            markersize=style.markersize,
-                            color=style.color,
-                            alpha=style.alpha
-                        )
+                    self._plot_line(ax_left, series_name, df, is_secondary=False)
         
         # Plot secondary series
         if ax_right and self.config.secondary_axis.series:
             for series_name in self.config.secondary_axis.series:
                 if series_name in df.columns:
-                    y = pd.to_numeric(df[series_name], errors="coerce")
-                    style = self.config.get_series_style(series_name, is_secondary=True)
-                    
-                    legend_label = self._get_legend_label(series_name)
-                    if x_key:
-                        ax_right.plot(
-                            df[x_key], y, 
-                            label=legend_label,
-                            linestyle=style.linestyle,
-                            linewidth=style.linewidth,
-                            marker=style.marker,
-                            markersize=style.markersize,
-                            color=style.color,
-                            alpha=style.alpha
-                        )
-                    else:
-                        ax_right.plot(
-                            y.index, y, 
-                            label=legend_label,
-                            linestyle=style.linestyle,
-                            linewidth=style.linewidth,
-                            marker=style.marker,
-                            markersize=style.markersize,
-                            color=style.color,
-                            alpha=style.alpha
-                        )
+                    self._plot_line(ax_right, series_name, df, is_secondary=True)
+    
+    def _plot_line(self, ax: Axes, series_name: str, plot_data: pd.DataFrame, is_secondary: bool):
+        """Plot one line series onto ax, tagged with its series name (gid)."""
+        # Downsampled (x, y) arrays take the place of the full columns when available
+        x, y = self._line_xy(series_name, plot_data)
+        style = self.config.get_series_style(series_name, is_secondary=is_secondary)
+        
+        legend_label = self._get_legend_label(series_name)
+        ax.plot(
+            x, y, 
+            gid=series_name,
+            label=legend_label,
+            linestyle=style.linestyle,
+            linewidth=style.linewidth,
+            marker=style.marker,
+            markersize=style.markersize,
+            color=style.color,
+            alpha=style.alpha
+        )
 
     def _render_bar_chart(self, ax_left: Axes, ax_right: Optional[Axes], plot_data: pd.DataFrame):
         """Render a bar chart."""
@@ -551,8 +734,8 @@ class ChartRenderer:
             cbar = self._figure.colorbar(scatter, ax=ax)
             cbar.set_label(f'{size_col}')
     
-    def _apply_formatting(self, ax_left: Axes, ax_right: Optional[Axes]):
-        """Apply formatting to the axes."""
+    def _apply_formatting(self, ax_left: Axes, ax_right: Optional[Axes], legends: bool = True):
+        """Apply formatting to the axes. legends=False leaves legends off regardless of the config."""
         
         # For status charts, auto-calculate Y-axis limits and tick positions
         # based on the number of series (using 1.5 spacing per series)
@@ -586,9 +769,7 @@ class ChartRenderer:
         # X-axis formatter for Time
         if x_key in ["Time", "Time (MM:SS)"]:
             def format_time(x, pos):
-                minutes = int(x // 60)
-                seconds = int(x % 60)
-                return f"{minutes:02d}:{seconds:02d}"
+                return seconds_to_min_sec(x)
             ax_left.xaxis.set_major_formatter(FuncFormatter(format_time))
         
         # Title
@@ -603,11 +784,17 @@ class ChartRenderer:
             )
         
         # Legends
-        if self.config.show_legend:
-            if self.config.primary_axis.series:
-                ax_left.legend(loc=self.config.primary_legend_loc)
-            if ax_right and self.config.secondary_axis.series:
-                ax_right.legend(loc=self.config.secondary_legend_loc)
+        self._update_legend(
+            ax_left,
+            legends and self.config.show_legend and bool(self.config.primary_axis.series),
+            self.config.primary_legend_loc
+        )
+        if ax_right:
+            self._update_legend(
+                ax_right,
+                legends and self.config.show_legend and bool(self.config.secondary_axis.series),
+                self.config.secondary_legend_loc
+            )
         
         # Apply axis limits
         if not self.config.primary_axis.auto_scale:
@@ -634,6 +821,26 @@ class ChartRenderer:
             if self.config.secondary_axis.tick_labels:
                 ax_right.set_yticklabels(self.config.secondary_axis.tick_labels)
     
+    def apply_axis_limits(self, ax_left: Axes, ax_right: Optional[Axes]):
+        """
+        Re-apply the config's y-axis limits to axes this chart type was already drawn on.
+        Auto-scaled axes go back to their automatic limits (the fixed strips of a status chart).
+        """
+        axes = (
+            (ax_left, self.config.primary_axis),
+            (ax_right, self.config.secondary_axis),
+        )
+        for ax, axis_config in axes:
+            if ax is None:
+                continue
+            if axis_config.auto_scale:
+                if self.config.chart_type == "status" and ax is ax_left:
+                    self._apply_status_chart_formatting(ax)
+                else:
+                    ax.autoscale(enable=True, axis="y")
+            elif axis_config.min_value is not None or axis_config.max_value is not None:
+                ax.set_ylim(bottom=axis_config.min_value, top=axis_config.max_value)
+    
     def _apply_status_chart_formatting(self, ax: Axes):
         """
         Auto-calculate and apply Y-axis limits and tick positions for status charts.
@@ -126,4 +126,4 @@ class CustomNavigationToolbar(NavigationToolbar2Tk):
                 watermark.remove()
             
             fig.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
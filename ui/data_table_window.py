@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+import numpy as np
 import pandas as pd
 import tksheet
 import threading
@@ -7,6 +8,33 @@ import threading
 # Lazy loading constants
 INITIAL_ROW_BATCH = 200  # Number of rows to load initially
 ROW_LOAD_BATCH = 200     # Number of rows to load when scrolling
+SCROLL_LOAD_THRESHOLD = 0.9  # Load more once the view passes this fraction of loaded rows
+LOAD_ALL_CHUNK = 2000   # Rows appended per step of "Load All", a frame apart
+
+# Column sizing: pixels per character, bounded to a sensible range
+COLUMN_CHAR_PX = 8
+MIN_COLUMN_WIDTH = 80
+MAX_COLUMN_WIDTH = 300
+# Column widths are measured on this many leading rows - enough for a typical cell length
+WIDTH_SAMPLE_ROWS = 2000
+
+# Whole-number floats up to this size are shown as integers (float64 holds every integer up to 2**53)
+FLOAT_EXACT_INT = 2.0 ** 53
+
+
+def _show_whole_floats_as_ints(df: pd.DataFrame, cells: np.ndarray) -> None:
+    """
+    Rewrite whole numbers in df's float columns as integer text in cells (df as strings).
+    Integer PIDs with gaps are stored as floats; they show as in the file ("849", not "849.0").
+    """
+    for i, dtype in enumerate(df.dtypes):
+        if dtype.kind != "f":
+            continue
+        values = df.iloc[:, i].to_numpy()
+        whole = np.isfinite(values) & (np.abs(values) < FLOAT_EXACT_INT)
+        whole[whole] = values[whole] == np.floor(values[whole])
+        if whole.any():
+            cells[whole, i] = values[whole].astype(np.int64).astype(str)
 
 
 class DataTableWindow:
@@ -19,12 +47,14 @@ class DataTableWindow:
         # Data prepared by background thread
         self._prepared_data = None
         self._prepared_cols = None
+        self._prepared_widths = None
         self._loading_cancelled = False
         
         # Lazy loading state
-        self._all_data = None  # Full dataset
+        self._all_data = None  # Full dataset as a 2-D array of strings; rows become lists only when loaded
         self._rows_loaded = 0  # Number of rows currently in sheet
         self._loading_more = False  # Prevent concurrent loads
+        self._loading_all = False  # "Load All" is still appending chunks
         
         # Search state
         self._search_matches = []  # List of (row, col) tuples
@@ -107,27 +137,44 @@ class DataTableWindow:
             raw_cols = list(self.snapshot.columns)
             safe_cols = []
             used = set()
+            # Last suffix handed out per base name, so the n-th duplicate doesn't re-test _2.._n
+            last_suffix = {}
             for i, c in enumerate(raw_cols):
                 name = str(c).strip()
                 if not name or name.lower() == "nan":
                     name = f"col_{i+1}"
-                base = name
-                k = 1
-                while name in used:
-                    k += 1
-                    name = f"{base}_{k}"
+                if name in used:
+                    base = name
+                    k = last_suffix.get(base, 1)
+                    # Only loops past suffixes a real column already uses (e.g. a PID named "X_2")
+                    while name in used:
+                        k += 1
+                        name = f"{base}_{k}"
+                    last_suffix[base] = k
                 used.add(name)
                 safe_cols.append(name)
 
             if self._loading_cancelled:
                 return
 
-            # Use a display copy with safe column names
-            df_display = self.snapshot.copy()
-            df_display.columns = safe_cols
-
-            # Convert DataFrame to list of lists (this is often the slow part)
-            all_data = df_display.astype(str).values.tolist()
+            # Stringify the DataFrame in one bulk pass (this is often the slow part).
+            # Safe column names only go to the sheet headers, so no display copy is needed.
+            # Rows stay in the array - only the batches actually shown are turned into lists
+            all_data = self.snapshot.astype(str).to_numpy()
+            _show_whole_floats_as_ints(self.snapshot, all_data)
+            # Missing values show as empty cells rather than "nan"/"NaT" - one mask for the whole table
+            all_data[self.snapshot.isna().to_numpy()] = ""
+
+            # Column widths from the 80th percentile cell length (or the header, if longer),
+            # measured for every column at once on a sample of the string array - converting
+            # all rows to a fixed-width unicode array would briefly need several times its memory
+            cell_lens = np.char.str_len(all_data[:WIDTH_SAMPLE_ROWS].astype(np.str_))
+            if len(cell_lens):
+                typical = np.quantile(cell_lens, 0.8, axis=0)
+            else:
+                typical = np.zeros(len(safe_cols))
+            header_lens = np.fromiter((len(c) for c in safe_cols), dtype=float, count=len(safe_cols))
+            widths = np.clip(np.maximum(typical, header_lens) * COLUMN_CHAR_PX, MIN_COLUMN_WIDTH, MAX_COLUMN_WIDTH)
 
             if self._loading_cancelled:
                 return
@@ -135,6 +182,7 @@ class DataTableWindow:
             # Store prepared data
             self._prepared_data = all_data
             self._prepared_cols = safe_cols
+            self._prepared_widths = widths.astype(int).tolist()
 
             # Schedule GUI creation on main thread
             self.win.after(0, self._create_sheet_on_main_thread)
@@ -161,7 +209,7 @@ class DataTableWindow:
         
         # Load only initial batch of rows
         initial_rows = min(INITIAL_ROW_BATCH, total_rows)
-        initial_data = self._all_data[:initial_rows]
+        initial_data = self._all_data[:initial_rows].tolist()
         self._rows_loaded = initial_rows
 
         # Create tksheet table widget with initial batch only
@@ -174,8 +222,10 @@ class DataTableWindow:
             show_row_index=True,
             show_header=True,
             show_top_left=True,
-            set_all_heights_and_widths=True
+            default_column_width=120
         )
+        # All widths in one call - users can still resize manually
+        self.sheet.set_column_widths(self._prepared_widths)
         self.sheet.pack(fill=tk.BOTH, expand=True)
 
         self.progress['value'] = 70
@@ -188,9 +238,9 @@ class DataTableWindow:
         self.progress['value'] = 85
         self.win.update_idletasks()
 
-        # Set default column width - users can resize manually
-        for i in range(len(self._prepared_cols)):
-            self.sheet.column_width(column=i, width=120)
+        # Materialize more rows as the user scrolls towards the end of what is loaded
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>", "<Next>", "<Down>"):
+            self.sheet.bind(sequence, self._on_sheet_scroll, add="+")
 
         # Refresh the sheet to ensure proper display
         self.sheet.refresh()
@@ -209,6 +259,7 @@ class DataTableWindow:
         # Clear prepared data reference (but keep _all_data for lazy loading)
         self._prepared_data = None
         self._prepared_cols = None
+        self._prepared_widths = None
 
     def _show_error(self, message: str):
         """Show error message if data preparation fails."""
@@ -228,11 +279,12 @@ class DataTableWindow:
             self.load_all_btn.config(state="disabled")
         else:
             self.rows_loaded_label.config(text=f"(Showing {self._rows_loaded} of {total} rows)")
-            self.load_more_btn.config(state="normal")
-            self.load_all_btn.config(state="normal")
+            state = "disabled" if self._loading_all else "normal"
+            self.load_more_btn.config(state=state)
+            self.load_all_btn.config(state=state)
 
-    def _load_more_rows(self):
-        """Load the next batch of rows into the sheet."""
+    def _load_more_rows(self, count: int = ROW_LOAD_BATCH):
+        """Load the next `count` rows into the sheet."""
         if self._loading_more or self._all_data is None:
             return
         if self._rows_loaded >= len(self._all_data):
@@ -243,14 +295,13 @@ class DataTableWindow:
         try:
             total = len(self._all_data)
             start_row = self._rows_loaded
-            end_row = min(start_row + ROW_LOAD_BATCH, total)
+            end_row = min(start_row + count, total)
             
             # Get the new rows to add
-            new_rows = self._all_data[start_row:end_row]
+            new_rows = self._all_data[start_row:end_row].tolist()
             
-            # Append rows to sheet
-            for row in new_rows:
-                self.sheet.insert_row(row)
+            # Append all rows in one call and redraw once at the end
+            self.sheet.insert_rows(rows=new_rows, redraw=False)
             
             self._rows_loaded = end_row
             self._update_rows_loaded_label()
@@ -259,13 +310,39 @@ class DataTableWindow:
         finally:
             self._loading_more = False
     
-    def _load_all_remaining_rows(self):
-        """Load all remaining rows (used before search)."""
-        if self._all_data is None:
+    def _on_sheet_scroll(self, event=None):
+        """Defer the scroll check until the sheet has moved its view."""
+        self.win.after_idle(self._load_more_if_near_end)
+
+    def _load_more_if_near_end(self):
+        """Load the next batch when the visible area reaches the end of the loaded rows."""
+        if not hasattr(self, 'sheet') or self._all_data is None:
             return
-        while self._rows_loaded < len(self._all_data):
+        if self._rows_loaded >= len(self._all_data):
+            return
+        _top, bottom = self.sheet.get_yview()
+        if bottom > SCROLL_LOAD_THRESHOLD:
             self._load_more_rows()
 
+    def _load_all_remaining_rows(self):
+        """Load all remaining rows, LOAD_ALL_CHUNK at a time so the window keeps responding."""
+        if self._all_data is None or self._loading_all:
+            return
+        self._loading_all = True
+        self._load_all_step()
+
+    def _load_all_step(self):
+        """Append the next chunk of rows and schedule the one after it."""
+        if self._loading_cancelled:
+            return
+        self._load_more_rows(LOAD_ALL_CHUNK)
+        if self._rows_loaded < len(self._all_data):
+            # ~one frame between chunks - the label shows progress as rows arrive
+            self.win.after(16, self._load_all_step)
+        else:
+            self._loading_all = False
+            self._update_rows_loaded_label()
+
     def _do_search(self):
         """Search all cells and headers for the search term and highlight matches."""
         if not hasattr(self, 'sheet'):
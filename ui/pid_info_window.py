@@ -1,13 +1,24 @@
 import tkinter as tk
 from tkinter import ttk
 
+# Rows inserted per idle callback so the window stays responsive while filling
+POPULATE_CHUNK = 100
+# Filtering waits this long after the last keystroke, so a burst of typing filters once
+SEARCH_DEBOUNCE_MS = 120
+
 
 class PidInfoWindow:
-    def __init__(self, parent, pid_info, snapshot_path, main_app):
+    def __init__(self, parent, pid_rows, snapshot_path, main_app):
         self.parent = parent
-        self.pid_info = pid_info
+        # (pid, description, unit) tuples, ready to insert as tree rows
+        self.pid_rows = pid_rows
         self.snapshot_path = snapshot_path
         self.main_app = main_app
+        self._populate_after_id = None
+        self._search_after_id = None
+        self._last_term = ""
+        # (row, lowercased description) - descriptions are lowercased once, not per keystroke
+        self._search_index = [(row, row[1].lower()) for row in pid_rows]
 
         self.window = tk.Toplevel(parent)
         self.window.attributes("-topmost", True)
@@ -25,7 +36,7 @@ class PidInfoWindow:
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10,0))
-        search_entry.bind("<KeyRelease>", self._filter_descriptions)
+        search_entry.bind("<KeyRelease>", self._schedule_filter)
 
         # Container for tree and scrollbar
         container = ttk.Frame(self.window)
@@ -55,43 +66,48 @@ class PidInfoWindow:
         # Bind double-click
         self.tree.bind("<Double-1>", self._on_double_click)
 
-        # Populate tree
-        self._populate_tree()
+        # Populate tree once the window has been drawn
+        self.window.after_idle(self._populate_tree)
 
     def _populate_tree(self):
-        # Clear existing
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        # Insert all
-        for pid, data in self.pid_info.items():
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    pid,
-                    data.get("Description", ""),
-                    data.get("Unit", "")
-                )
-            )
+        self._show_rows(self.pid_rows)
+
+    def _schedule_filter(self, event=None):
+        """Restart the debounce timer - only the last keystroke of a burst filters the tree."""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+        self._search_after_id = self.window.after(SEARCH_DEBOUNCE_MS, self._filter_descriptions)
 
     def _filter_descriptions(self, event=None):
+        self._search_after_id = None
         term = self.search_var.get().strip().lower()
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        # Filter and insert
-        for pid, data in self.pid_info.items():
-            desc = data.get("Description", "").lower()
-            if term in desc:
-                self.tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        pid,
-                        data.get("Description", ""),
-                        data.get("Unit", "")
-                    )
-                )
+        # Arrow keys, Shift, etc. release keys too - nothing to do if the term didn't change
+        if term == self._last_term:
+            return
+        self._last_term = term
+        self._show_rows([row for row, description in self._search_index if term in description])
+
+    def _show_rows(self, items):
+        """Replace the tree contents with items, inserting them in chunks."""
+        # Stop any fill still in progress from a previous call
+        if self._populate_after_id is not None:
+            self.window.after_cancel(self._populate_after_id)
+            self._populate_after_id = None
+        self.tree.delete(*self.tree.get_children())
+        self._insert_chunk(items, 0)
+
+    def _insert_chunk(self, items, start):
+        """Insert the next chunk of rows and schedule the one after it."""
+        self._populate_after_id = None
+        if not self.tree.winfo_exists():
+            return
+        end = start + POPULATE_CHUNK
+        insert = self.tree.insert
+        for row in items[start:end]:
+            insert("", "end", values=row)
+        if end < len(items):
+            # ~one frame between chunks
+            self._populate_after_id = self.window.after(16, self._insert_chunk, items, end)
 
     def _on_double_click(self, event):
         selected = self.tree.selection()
@@ -113,19 +129,11 @@ class PidInfoWindow:
         ttk.Label(choice_win, text=f"Add '{pid}' to which axis?").pack(pady=10)
 
         def add_to_primary():
-            if pid not in self.main_app.primary_series:
-                self.main_app.primary_series.append(pid)
-                self.main_app.primary_list.insert(tk.END, pid)
-                if self.main_app.engine is not None:
-                    self.main_app.plot_combo_chart()
+            self.main_app.add_series("primary", [pid])
             choice_win.destroy()
 
         def add_to_secondary():
-            if pid not in self.main_app.secondary_series:
-                self.main_app.secondary_series.append(pid)
-                self.main_app.secondary_list.insert(tk.END, pid)
-                if self.main_app.engine is not None:
-                    self.main_app.plot_combo_chart()
+            self.main_app.add_series("secondary", [pid])
             choice_win.destroy()
 
         btn_frame = ttk.Frame(choice_win)
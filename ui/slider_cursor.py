@@ -0,0 +1,81 @@
+# Slider-driven vertical cursor line, redrawn by blitting
+from matplotlib.axes import Axes
+from matplotlib.widgets import Slider
+
+# Minimum time between cursor line redraws while the slider is dragged (~60 FPS)
+SLIDER_FRAME_MS = 16
+
+
+class SliderCursorLine:
+    """
+    Vertical line that follows a time Slider.
+
+    Moving the slider only redraws the line and the slider itself on top of a cached
+    background (blitting), instead of re-rendering every plotted series with a full
+    canvas draw.
+    """
+
+    def __init__(self, canvas, ax: Axes, slider: Slider, x: float):
+        self.canvas = canvas
+        self.ax = ax
+        self.slider = slider
+
+        # Animated artists are left out of normal draws - we draw them ourselves
+        self.line = ax.axvline(x=x, color='red', alpha=0.5, linestyle='--', animated=True)
+        slider.ax.set_animated(True)
+        slider.drawon = False
+
+        # Background is (re)captured after every full draw, so pan/zoom/resize stay correct
+        self._background = None
+        self._cids = [
+            canvas.mpl_connect("draw_event", self._on_draw),
+            canvas.mpl_connect("resize_event", self._on_resize),
+        ]
+        # Drag events arrive faster than frames - only the latest value is drawn once per frame
+        self._pending_x = None
+        self._frame_job = None
+        self._slider_cid = slider.on_changed(self._on_slider_changed)
+
+    def _on_slider_changed(self, x: float):
+        self._pending_x = x
+        if self._frame_job is None:
+            self._frame_job = self.canvas.get_tk_widget().after(SLIDER_FRAME_MS, self._flush)
+
+    def _flush(self):
+        self._frame_job = None
+        self.move_to(self._pending_x)
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn background, then put the animated artists back on it."""
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        """The cached background no longer matches the canvas size - drop it until the next draw."""
+        self._background = None
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self.line)
+        self.canvas.figure.draw_artist(self.slider.ax)
+
+    def move_to(self, x: float):
+        """Move the line to x and blit just the changed artists."""
+        self.line.set_xdata([x, x])
+        if self._background is None:
+            # Nothing drawn yet - a normal draw will capture the background
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def remove(self):
+        """Disconnect from the canvas and slider and remove the line."""
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        # The slider may be reused for the next chart - stop following it
+        self.slider.disconnect(self._slider_cid)
+        if self._frame_job is not None:
+            self.canvas.get_tk_widget().after_cancel(self._frame_job)
+            self._frame_job = None
+        self.line.remove()
@@ -2,12 +2,17 @@
 Utility functions for the Snapshot Decoder application.
 
 This module contains shared utility functions used across different layers
-of the application, including infrastructure concerns like resource path resolution.
+of the application, including infrastructure concerns like resource path resolution
+and time unit conversions.
 """
 
+import functools
+import math
 import os
 import sys
 
+import numpy as np
+
 
 def resource_path(relative_path):
     """
@@ -29,3 +34,52 @@ def resource_path(relative_path):
     else:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
+
+
+def seconds_to_hours(seconds, decimals=1):
+    """
+    Convert seconds to hours, rounded to the given number of decimals.
+
+    Accepts a scalar or an array/Series. Arrays are converted in one numpy pass.
+
+    Args:
+        seconds: Value or values in seconds
+        decimals: Number of decimal places to round to
+
+    Returns:
+        float for scalar input, numpy array of floats otherwise
+    """
+    if np.ndim(seconds) == 0:
+        return round(float(seconds) / 3600, decimals)
+    return np.round(np.asarray(seconds, dtype=float) / 3600.0, decimals)
+
+
+def seconds_to_min_sec(seconds):
+    """
+    Format seconds as an MM:SS string.
+
+    Accepts a scalar or an array/Series. Arrays are formatted in one numpy pass
+    and returned as an array of strings.
+
+    Args:
+        seconds: Value or values in seconds
+
+    Returns:
+        str for scalar input, numpy array of str otherwise
+    """
+    if np.ndim(seconds) == 0:
+        return _min_sec_label(math.floor(seconds))
+    whole = np.floor(np.asarray(seconds, dtype=float)).astype(np.int64)
+    minutes, secs = np.divmod(whole, 60)
+    return np.char.add(
+        np.char.add(np.char.zfill(minutes.astype(str), 2), ":"),
+        np.char.zfill(secs.astype(str), 2),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _min_sec_label(whole_seconds: int) -> str:
+    """MM:SS label for a whole number of seconds. Memoized - hover tooltips and axis ticks
+    ask for the same few seconds over and over."""
+    minutes, secs = divmod(whole_seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"